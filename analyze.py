@@ -9,28 +9,44 @@ __version__ = "1.7.1"
 
 import zipfile
 import json
-import tempfile
-import shutil
+import hashlib
+import os
+import posixpath
 import sys
+import tempfile
 import argparse
 import logging
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable, Tuple, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Callable, Iterable, Tuple, Union
 
-# Use defusedxml to prevent XXE attacks - required dependency
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+
+# XML is parsed with expat directly; XXE protection comes from the handlers
+# installed by _make_safe_parser. defusedxml (required) only supplies the
+# exception types those handlers raise.
 try:
-    import defusedxml.ElementTree as ET
+    from defusedxml import EntitiesForbidden, ExternalReferenceForbidden
 except ImportError:
     raise ImportError(
         "Required package 'defusedxml' is not installed. "
         "Install it with: pip install defusedxml"
     )
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
-from rich.markup import escape
+# orjson is optional - a faster drop-in for parsing and writing JSON
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Rich is imported inside the output functions, so --json, --version and
+# early errors don't pay for loading it
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.table import Table
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -56,7 +72,21 @@ BOOL_TRUE = '1'
 BOOL_FALSE = '0'
 
 # Infill density setting keys (skeleton_infill_density is legacy alias)
-INFILL_DENSITY_KEYS = ('sparse_infill_density', 'skeleton_infill_density')
+INFILL_DENSITY_KEYS = frozenset({'sparse_infill_density', 'skeleton_infill_density'})
+
+# Object metadata keys mirrored from custom_settings into obj_data fields.
+# Maps metadata key -> obj_data field.
+META_DIRECT = {
+    'layer_height': 'layer_height',
+    'wall_loops': 'wall_loops',
+    'enable_support': 'enable_support',
+    'brim_type': 'brim_type',
+    'outer_wall_speed': 'outer_wall_speed',
+    'inner_wall_speed': 'inner_wall_speed',
+}
+
+# Object override keys that are mirrored into obj_data fields
+OBJECT_TRACKED_KEYS = frozenset(META_DIRECT) | INFILL_DENSITY_KEYS
 
 # Filament colors by number for table display
 FILAMENT_COLORS = ('cyan', 'magenta', 'green', 'yellow', 'blue', 'red')
@@ -68,6 +98,112 @@ PLATE_COLORS = (
     'medium_purple1', 'gold1',
 )
 
+# Objects table columns as (header, Table.add_column options)
+OBJECT_COLUMN_SPECS = (
+    ("Plate", MappingProxyType({'justify': 'center', 'style': 'white', 'width': 5})),
+    ("Name", MappingProxyType({'style': 'white', 'min_width': 20, 'max_width': 50})),
+    ("Filament", MappingProxyType({'justify': 'center', 'width': 8})),
+    ("Layer Height", MappingProxyType({'justify': 'center'})),
+    ("Wall Loops", MappingProxyType({'justify': 'center'})),
+    ("Infill Density", MappingProxyType({'justify': 'center'})),
+    ("Support", MappingProxyType({'justify': 'center', 'width': 7})),
+    ("Brim Type", MappingProxyType({'justify': 'center'})),
+    ("Outer Wall Speed", MappingProxyType({'justify': 'center'})),
+)
+
+# Column headers shared by the Rich and plain-text objects tables
+OBJECT_COLUMNS = tuple(header for header, _ in OBJECT_COLUMN_SPECS)
+
+# Profile fields read from project_settings: (profile key, project_settings key).
+# List values are reduced to their first element; missing values become ''.
+PROFILE_FIELDS = (
+    # Basic settings
+    ('layer_height', 'layer_height'),
+    ('initial_layer_print_height', 'initial_layer_print_height'),
+    ('nozzle', 'nozzle_diameter'),
+    ('line_width', 'line_width'),
+    ('wall_loops', 'wall_loops'),
+    ('sparse_infill_density', 'sparse_infill_density'),
+    ('brim_type', 'brim_type'),
+    ('enable_support', 'enable_support'),
+    # Flow
+    ('print_flow_ratio', 'print_flow_ratio'),
+    ('filament_flow_ratio', 'filament_flow_ratio'),
+    # Speeds
+    ('initial_layer_speed', 'initial_layer_speed'),
+    ('outer_wall_speed', 'outer_wall_speed'),
+    ('inner_wall_speed', 'inner_wall_speed'),
+    ('sparse_infill_speed', 'sparse_infill_speed'),
+    ('top_surface_speed', 'top_surface_speed'),
+    ('travel_speed', 'travel_speed'),
+    ('bridge_speed', 'bridge_speed'),
+    # Shells
+    ('top_shell_layers', 'top_shell_layers'),
+    ('bottom_shell_layers', 'bottom_shell_layers'),
+    # Seams
+    ('seam_position', 'seam_position'),
+    # === Extended settings ===
+    # Patterns
+    ('sparse_infill_pattern', 'sparse_infill_pattern'),
+    ('top_surface_pattern', 'top_surface_pattern'),
+    # Special modes
+    ('ironing_type', 'ironing_type'),
+    ('fuzzy_skin', 'fuzzy_skin'),
+    ('spiral_mode', 'spiral_mode'),
+    # Retraction and Z
+    ('retraction_length', 'retraction_length'),
+    ('retraction_speed', 'retraction_speed'),
+    ('z_hop', 'z_hop'),
+    # Fan
+    ('fan_min_speed', 'fan_min_speed'),
+    ('fan_max_speed', 'fan_max_speed'),
+    # Cooling
+    ('slow_down_for_layer_cooling', 'slow_down_for_layer_cooling'),
+    ('slow_down_layer_time', 'slow_down_layer_time'),
+    # Advanced
+    ('pressure_advance', 'pressure_advance'),
+    ('enable_arc_fitting', 'enable_arc_fitting'),
+    ('enable_overhang_speed', 'enable_overhang_speed'),
+    # Print modes
+    ('print_sequence', 'print_sequence'),
+    ('timelapse_type', 'timelapse_type'),
+    # Supports
+    ('support_type', 'support_type'),
+    # Temperatures
+    ('nozzle_temperature', 'nozzle_temperature'),
+    ('bed_temperature', 'hot_plate_temp'),
+)
+
+# Sentinel for dict lookups where None is a valid value
+_MISSING = object()
+
+# Row prototypes for _build_result, copied per row. Key order is the JSON
+# output order; part rows pre-fill the fields parts never override.
+_OBJECT_ROW_TEMPLATE = {
+    'plate': None, 'name': None, 'is_parent': True, 'is_part': False, 'filament': None,
+    'layer_height': None, 'layer_custom': None, 'wall_loops': None, 'walls_custom': None,
+    'infill': None, 'infill_custom': None, 'support': None, 'support_custom': None,
+    'brim': None, 'brim_custom': None, 'outer_wall_speed': None, 'speed_custom': None,
+    'custom_settings': None,
+}
+_PART_ROW_TEMPLATE = {
+    **_OBJECT_ROW_TEMPLATE,
+    'plate': '', 'is_parent': False, 'is_part': True,
+    'layer_height': '', 'layer_custom': False,
+    'support_custom': False, 'brim': '', 'brim_custom': False,
+}
+
+# Blank cells after the Name column on an objects-table custom-settings row
+_EMPTY_TAIL_CELLS = ("",) * (len(OBJECT_COLUMN_SPECS) - 2)
+
+# Unpacks the display fields of a result row in one call (objects table)
+_row_fields = itemgetter(
+    'plate', 'name', 'is_parent', 'filament',
+    'layer_height', 'layer_custom', 'wall_loops', 'walls_custom',
+    'infill', 'infill_custom', 'support', 'support_custom',
+    'brim', 'brim_custom', 'outer_wall_speed', 'speed_custom',
+)
+
 # Default extruder number (first extruder)
 DEFAULT_EXTRUDER = '1'
 
@@ -77,15 +213,187 @@ DEFAULT_IDENTIFY_ID = 0
 # 3MF file extension
 FILE_EXTENSION_3MF = '.3mf'
 
+# Environment variable overriding the result cache directory
+CACHE_DIR_ENV = 'THREEMF_ANALYZER_CACHE_DIR'
+
+# Result cache schema; bump whenever result shape or semantics change so
+# entries written by older code are not served back.
+#   2: sparse_infill_density takes precedence over skeleton_infill_density
+#   3: floats are written by the stdlib encoder (NaN was stored as null)
+_CACHE_SCHEMA = 3
+
+# Most result cache entries kept on disk; older ones are pruned on write
+CACHE_MAX_ENTRIES = 256
+
+# Archive members holding slicer settings (the only ones we read)
+PROJECT_SETTINGS_MEMBER = 'Metadata/project_settings.config'
+MODEL_SETTINGS_MEMBER = 'Metadata/model_settings.config'
+
 
 # ═══════════════════════════════════════════════════════════════
 # Analyzer
 # ═══════════════════════════════════════════════════════════════
 
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available.
+    
+    Falls back to the stdlib parser (decoding invalid UTF-8 with
+    replacement characters) for input orjson rejects, so both paths
+    accept the same documents.
+    
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data.decode('utf-8', errors='replace'))
+
+
+def _forbid_entity_decl(name, is_parameter_entity, value, base, sysid, pubid, notation_name):
+    raise EntitiesForbidden(name, value, base, sysid, pubid, notation_name)
+
+
+def _forbid_unparsed_entity_decl(name, base, sysid, pubid, notation_name):
+    raise EntitiesForbidden(name, None, base, sysid, pubid, notation_name)
+
+
+def _forbid_external_ref(context, base, sysid, pubid):
+    raise ExternalReferenceForbidden(context, base, sysid, pubid)
+
+
+def _make_safe_parser(builder: ET.TreeBuilder, end_handler: Callable[[str], Any]):
+    """Create an expat parser that feeds builder and rejects XXE constructs.
+    
+    Uses the same rules as defusedxml (entity declarations and external
+    references raise), but drives the C TreeBuilder directly instead of
+    defusedxml's pure-Python ElementTree parser, which is about twice as slow.
+    
+    Args:
+        builder: TreeBuilder receiving start/data events.
+        end_handler: Called with the tag name of each closing element.
+    """
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = builder.start
+    parser.EndElementHandler = end_handler
+    parser.CharacterDataHandler = builder.data
+    parser.EntityDeclHandler = _forbid_entity_decl
+    parser.UnparsedEntityDeclHandler = _forbid_unparsed_entity_decl
+    parser.ExternalEntityRefHandler = _forbid_external_ref
+    # Route external DTD references through _forbid_external_ref as well;
+    # expat would otherwise skip them silently
+    parser.SetParamEntityParsing(expat.XML_PARAM_ENTITY_PARSING_UNLESS_STANDALONE)
+    return parser
+
+
+def _contains_float(obj: Any) -> bool:
+    """Check whether a JSON-like structure holds any float value."""
+    stack = [obj]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        item = pop()
+        t = type(item)
+        if t is str:
+            continue
+        if t is dict:
+            push(item.values())
+        elif t is list or t is tuple:
+            push(item)
+        elif isinstance(item, float):
+            return True
+    return False
+
+
+def _dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available.
+    
+    Non-ASCII characters are written as-is. Falls back to the stdlib
+    encoder for objects orjson cannot serialize, and for payloads with
+    floats: orjson writes NaN/Infinity as null and formats exponents
+    differently, which would change --json output and cached results.
+    
+    Args:
+        obj: The object to serialize.
+        indent: Pretty-print with two-space indentation.
+    """
+    if orjson is not None and not _contains_float(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+class _PartRecord:
+    """Settings parsed from a <part> element."""
+    
+    __slots__ = ('name', 'extruder', 'custom_settings')
+    
+    def __init__(self):
+        self.name: Optional[str] = None
+        self.extruder: Optional[str] = None
+        self.custom_settings: Dict[str, Any] = {}
+
+
+class _ObjectRecord:
+    """Settings parsed from an <object> element.
+    
+    A __slots__ class rather than a dict: one is kept per object until the
+    result is built, and attribute access is cheaper than key lookups.
+    """
+    
+    __slots__ = ('name', 'extruder', 'custom_settings', 'parts', 'layer_height', 'wall_loops',
+                 'enable_support', 'brim_type', 'outer_wall_speed', 'inner_wall_speed',
+                 'sparse_infill_density')
+    
+    def __init__(self):
+        self.name: Optional[str] = None
+        self.extruder: Optional[str] = DEFAULT_EXTRUDER
+        self.custom_settings: Dict[str, Any] = {}
+        self.parts: List[_PartRecord] = []
+        self.layer_height = None
+        self.wall_loops = None
+        self.enable_support = None
+        self.brim_type = None
+        self.outer_wall_speed = None
+        self.inner_wall_speed = None
+        self.sparse_infill_density = None
+
+
+def _collect_metadata(elem, record: Union[_ObjectRecord, _PartRecord],
+                      keep_empty: frozenset = frozenset()) -> None:
+    """Collect the <metadata> children of an <object> or <part> element.
+    
+    'name' and 'extruder' are set on record; every other non-system key
+    with a value goes into record.custom_settings. Keys in keep_empty are
+    recorded there even when the value attribute is missing.
+    """
+    custom = record.custom_settings
+    for meta in elem.iterfind('metadata'):
+        attrib = meta.attrib
+        key = attrib.get('key')
+        value = attrib.get('value')
+        if value is not None and key not in SYSTEM_KEYS:
+            custom[key] = value
+        elif key == 'name':
+            record.name = value
+        elif key == 'extruder':
+            record.extruder = value
+        elif key in keep_empty:
+            custom[key] = value
+
+
 def _is_custom(obj_val: Any, global_val: Any) -> bool:
     """Check if object value differs from global profile value."""
     if obj_val is None:
         return False
+    # 3MF values are almost always strings on both sides: compare directly
+    if type(obj_val) is str and type(global_val) is str:
+        return obj_val != global_val
     return str(obj_val) != str(global_val)
 
 
@@ -94,18 +402,25 @@ class ThreeMFAnalyzer:
     
     def __init__(self, filepath: Union[str, Path]):
         self.filepath = Path(filepath)
-        self.temp_dir: Optional[Path] = None
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._members: frozenset = frozenset()
         self.project_settings: Dict = {}
-        self.objects: Dict[str, Dict] = {}
+        self.objects: Dict[str, _ObjectRecord] = {}
         self.plates: List[Dict] = []
         
-    def analyze(self) -> Dict[str, Any]:
-        """Main analysis method. Extracts and returns all settings from the 3MF file."""
+    def analyze(self, parse_model: bool = True) -> Dict[str, Any]:
+        """Main analysis method. Reads and returns all settings from the 3MF file.
+        
+        Args:
+            parse_model: If False, skip model_settings.config entirely; the
+                result then has the profile and global settings but no rows.
+        """
         logger.debug("Starting analysis of file: %s", self.filepath)
         self._extract()
         try:
             self._parse_project_settings()
-            self._parse_model_settings()
+            if parse_model:
+                self._parse_model_settings()
             result = self._build_result()
             logger.debug("Successfully analyzed %d objects", len(self.objects))
             return result
@@ -113,55 +428,57 @@ class ThreeMFAnalyzer:
             self._cleanup()
     
     def _extract(self):
-        """Extract 3MF archive with Zip Slip protection.
+        """Open 3MF archive for in-memory reading with Zip Slip protection.
         
-        Validates all paths in the archive to prevent path traversal attacks.
-        Uses a temporary directory that will be cleaned up in _cleanup().
+        Only the metadata members are read later, straight from the archive,
+        so nothing is written to disk. Member names are still validated to
+        reject malformed or malicious archives early.
+        The archive stays open until _cleanup().
         
         Raises:
             ValueError: If archive contains unsafe paths (Zip Slip attack).
             zipfile.BadZipFile: If the file is not a valid ZIP archive.
-            OSError: If extraction fails due to filesystem issues.
+            OSError: If the archive cannot be opened.
         """
-        self.temp_dir = Path(tempfile.mkdtemp())
         try:
-            with zipfile.ZipFile(self.filepath, 'r') as z:
-                # Zip Slip protection: validate all paths before extraction
-                for member in z.namelist():
-                    member_path = Path(member)
-                    # Check for absolute paths or path traversal
-                    if member_path.is_absolute():
-                        raise ValueError(f"Unsafe absolute path in archive: {member}")
-                    # Resolve and check if path stays within temp_dir
-                    target_path = (self.temp_dir / member).resolve()
-                    if not target_path.is_relative_to(self.temp_dir.resolve()):
-                        raise ValueError(f"Path traversal detected in archive: {member}")
-                z.extractall(self.temp_dir)
+            self._zip = zipfile.ZipFile(self.filepath, 'r')
+            names = self._zip.namelist()
+            # Zip Slip protection: validate all paths in the archive
+            # (pure string checks, no filesystem access per member)
+            for member in names:
+                normalized = member.replace('\\', '/')
+                # Check for absolute paths (POSIX, UNC or Windows drive)
+                if normalized.startswith('/') or normalized[1:2] == ':':
+                    raise ValueError(f"Unsafe absolute path in archive: {member}")
+                # Check for path traversal outside the archive root
+                target = posixpath.normpath(normalized)
+                if target == '..' or target.startswith('../'):
+                    raise ValueError(f"Path traversal detected in archive: {member}")
+            self._members = frozenset(names)
         except zipfile.BadZipFile as e:
-            self._cleanup_on_error()
+            self._cleanup()
             raise zipfile.BadZipFile(f"Invalid or corrupted 3MF file: {self.filepath}") from e
         except ValueError:
             # Re-raise security-related errors without wrapping
-            self._cleanup_on_error()
+            self._cleanup()
+            raise
+        except FileNotFoundError:
+            # Missing file: keep the specific type so callers can report it
+            self._cleanup()
             raise
         except OSError as e:
-            self._cleanup_on_error()
-            raise OSError(f"Failed to extract 3MF archive '{self.filepath}': {e}") from e
+            self._cleanup()
+            raise OSError(f"Failed to open 3MF archive '{self.filepath}': {e}") from e
         except Exception as e:
-            self._cleanup_on_error()
-            raise RuntimeError(f"Unexpected error extracting '{self.filepath}'") from e
-    
-    def _cleanup_on_error(self):
-        """Cleanup temp directory on extraction error."""
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
-        self.temp_dir = None
+            self._cleanup()
+            raise RuntimeError(f"Unexpected error opening '{self.filepath}'") from e
     
     def _cleanup(self):
-        """Cleanup temporary files"""
-        if self.temp_dir and self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-        self.temp_dir = None
+        """Close the 3MF archive"""
+        if self._zip is not None:
+            self._zip.close()
+        self._zip = None
+        self._members = frozenset()
     
     def _parse_project_settings(self):
         """Parse project_settings.config (JSON).
@@ -170,21 +487,20 @@ class ThreeMFAnalyzer:
             json.JSONDecodeError: If the config file contains invalid JSON.
             OSError: If the file cannot be read.
         """
-        config_path = self.temp_dir / "Metadata" / "project_settings.config"
-        if config_path.exists():
-            logger.debug("Parsing project settings from: %s", config_path)
+        if PROJECT_SETTINGS_MEMBER in self._members:
+            logger.debug("Parsing project settings from: %s", PROJECT_SETTINGS_MEMBER)
             try:
-                with open(config_path, 'r', encoding='utf-8', errors='replace') as f:
-                    self.project_settings = json.load(f)
+                data = self._zip.read(PROJECT_SETTINGS_MEMBER)
+                self.project_settings = _loads_json(data)
             except json.JSONDecodeError as e:
                 raise json.JSONDecodeError(
                     f"Invalid JSON in project_settings.config: {e.msg}",
                     e.doc, e.pos
                 ) from e
             except OSError as e:
-                raise OSError(f"Failed to read project settings: {config_path}") from e
+                raise OSError(f"Failed to read project settings: {PROJECT_SETTINGS_MEMBER}") from e
         else:
-            logger.warning("Project settings file not found: %s", config_path)
+            logger.warning("Project settings file not found: %s", PROJECT_SETTINGS_MEMBER)
     
     def _parse_model_settings(self):
         """Parse model_settings.config (XML).
@@ -192,139 +508,111 @@ class ThreeMFAnalyzer:
         Raises:
             ET.ParseError: If the config file contains invalid XML.
         """
-        config_path = self.temp_dir / "Metadata" / "model_settings.config"
-        if not config_path.exists():
-            logger.warning("Model settings file not found: %s", config_path)
+        if MODEL_SETTINGS_MEMBER not in self._members:
+            logger.warning("Model settings file not found: %s", MODEL_SETTINGS_MEMBER)
             return
         
-        logger.debug("Parsing model settings from: %s", config_path)
+        logger.debug("Parsing model settings from: %s", MODEL_SETTINGS_MEMBER)
+        
+        builder = ET.TreeBuilder()
+        builder_end = builder.end
+        parse_object = self._parse_object
+        parse_plate = self._parse_plate
+        
+        # Stream the document: handle each <object>/<plate> as soon as it is
+        # complete, then drop its subtree to keep memory flat.
+        def end(tag):
+            elem = builder_end(tag)
+            if tag == 'object':
+                parse_object(elem)
+                elem.clear()
+            elif tag == 'plate':
+                parse_plate(elem)
+                elem.clear()
         
         try:
-            tree = ET.parse(config_path)
-            root = tree.getroot()
-        except ET.ParseError as e:
-            # ET.ParseError inherits from SyntaxError and doesn't accept custom messages.
-            # Log context and re-raise the original exception.
+            with self._zip.open(MODEL_SETTINGS_MEMBER) as f:
+                _make_safe_parser(builder, end).ParseFile(f)
+        except expat.ExpatError as e:
+            # Report malformed XML as ET.ParseError, like ElementTree does
             logger.error("Invalid XML in model_settings.config: %s", e)
-            raise
+            err = ET.ParseError(str(e))
+            err.code = e.code
+            err.position = (e.lineno, e.offset)
+            raise err from None
         
         # Validate root element
+        root = builder.close()
         if root.tag != 'config':
             logger.warning("Unexpected root element '%s' in model_settings.config, expected 'config'", root.tag)
+    
+    def _parse_object(self, obj):
+        """Parse a single <object> element and its parts into self.objects."""
+        obj_id = obj.attrib.get('id')
         
-        # Parse all objects
-        for obj in root.findall('.//object'):
-            obj_id = obj.get('id')
-            
-            obj_data = {
-                'name': None,
-                'extruder': DEFAULT_EXTRUDER,
-                'layer_height': None,
-                'wall_loops': None,
-                'sparse_infill_density': None,
-                'enable_support': None,
-                'brim_type': None,
-                'outer_wall_speed': None,
-                'inner_wall_speed': None,
-                'custom_settings': {},  # All custom settings for the object
-                'parts': []
-            }
-            
-            for meta in obj.findall('metadata'):
-                key = meta.get('key')
-                value = meta.get('value')
-                
-                if key == 'name':
-                    obj_data['name'] = value
-                elif key == 'extruder':
-                    obj_data['extruder'] = value
-                elif key == 'layer_height':
-                    obj_data['layer_height'] = value
-                    obj_data['custom_settings']['layer_height'] = value
-                elif key == 'wall_loops':
-                    obj_data['wall_loops'] = value
-                    obj_data['custom_settings']['wall_loops'] = value
-                elif key in INFILL_DENSITY_KEYS:
-                    if obj_data['sparse_infill_density'] is None:
-                        obj_data['sparse_infill_density'] = value
-                    obj_data['custom_settings'][key] = value
-                elif key == 'enable_support':
-                    obj_data['enable_support'] = value
-                    obj_data['custom_settings']['enable_support'] = value
-                elif key == 'brim_type':
-                    obj_data['brim_type'] = value
-                    obj_data['custom_settings']['brim_type'] = value
-                elif key == 'outer_wall_speed':
-                    obj_data['outer_wall_speed'] = value
-                    obj_data['custom_settings']['outer_wall_speed'] = value
-                elif key == 'inner_wall_speed':
-                    obj_data['inner_wall_speed'] = value
-                    obj_data['custom_settings']['inner_wall_speed'] = value
-                elif key not in SYSTEM_KEYS and value is not None:
-                    # Any other custom settings
-                    obj_data['custom_settings'][key] = value
-            
-            # Object parts
-            for part in obj.findall('part'):
-                part_data = {
-                    'name': None, 
-                    'extruder': None,
-                    'custom_settings': {},  # All custom settings for the part
-                }
-                for meta in part.findall('metadata'):
-                    key = meta.get('key')
-                    value = meta.get('value')
-                    if key == 'name':
-                        part_data['name'] = value
-                    elif key == 'extruder':
-                        part_data['extruder'] = value
-                    elif key not in SYSTEM_KEYS and value is not None:
-                        # All other settings are custom
-                        part_data['custom_settings'][key] = value
-                obj_data['parts'].append(part_data)
-            
-            self.objects[obj_id] = obj_data
+        obj_data = _ObjectRecord()
+        _collect_metadata(obj, obj_data, OBJECT_TRACKED_KEYS)
         
-        # Parse plates
-        for plate in root.findall('.//plate'):
-            plate_id = None
-            plate_name = None
-            plate_objects = []
-            
-            for meta in plate.findall('metadata'):
-                key = meta.get('key')
-                value = meta.get('value')
-                if key == 'plater_id':
-                    plate_id = value
-                elif key == 'plater_name':
-                    plate_name = value
-            
-            for inst in plate.findall('model_instance'):
-                obj_id = None
-                identify_id = 0
-                for meta in inst.findall('metadata'):
-                    key = meta.get('key')
-                    value = meta.get('value')
-                    if key == 'object_id':
-                        obj_id = value
-                    elif key == 'identify_id':
-                        try:
-                            identify_id = int(value)
-                        except (ValueError, TypeError):
-                            logger.warning("Invalid identify_id value '%s', using default %d", value, DEFAULT_IDENTIFY_ID)
-                            identify_id = DEFAULT_IDENTIFY_ID
-                if obj_id:
-                    plate_objects.append({'object_id': obj_id, 'identify_id': identify_id})
-            
-            # Sort by identify_id ascending (matches slicer display order)
-            plate_objects.sort(key=lambda x: x['identify_id'])
-            
-            if plate_id:
-                self.plates.append({
-                    'id': plate_id,
-                    'name': plate_name,
-                    'objects': [obj['object_id'] for obj in plate_objects]
-                })
+        # Tracked fields are derived from the collected overrides
+        custom = obj_data.custom_settings
+        for key, attr in META_DIRECT.items():
+            setattr(obj_data, attr, custom.get(key))
+        obj_data.sparse_infill_density = (
+            custom.get('sparse_infill_density') or custom.get('skeleton_infill_density')
+        )
+        
+        # Object parts
+        parts = obj_data.parts
+        for part in obj.iterfind('part'):
+            part_data = _PartRecord()
+            _collect_metadata(part, part_data)
+            parts.append(part_data)
+        
+        self.objects[obj_id] = obj_data
+    
+    def _parse_plate(self, plate):
+        """Parse a single <plate> element into self.plates."""
+        plate_id = None
+        plate_name = None
+        plate_objects = []
+        
+        for meta in plate.iterfind('metadata'):
+            attrib = meta.attrib
+            key = attrib.get('key')
+            value = attrib.get('value')
+            if key == 'plater_id':
+                plate_id = value
+            elif key == 'plater_name':
+                plate_name = value
+        
+        for inst in plate.iterfind('model_instance'):
+            obj_id = None
+            identify_id = 0
+            for meta in inst.iterfind('metadata'):
+                attrib = meta.attrib
+                key = attrib.get('key')
+                value = attrib.get('value')
+                if key == 'object_id':
+                    obj_id = value
+                elif key == 'identify_id':
+                    try:
+                        identify_id = int(value)
+                    except (ValueError, TypeError):
+                        logger.warning("Invalid identify_id value '%s', using default %d", value, DEFAULT_IDENTIFY_ID)
+                        identify_id = DEFAULT_IDENTIFY_ID
+            if obj_id:
+                plate_objects.append((identify_id, obj_id))
+        
+        # Sort by identify_id ascending (matches slicer display order); the
+        # key keeps instances with equal identify_id in document order
+        plate_objects.sort(key=itemgetter(0))
+        
+        if plate_id:
+            self.plates.append({
+                'id': plate_id,
+                'name': plate_name,
+                'objects': [obj_id for _, obj_id in plate_objects]
+            })
     
     def _get_value(self, key: str, default=None, index: int = 0):
         """Get value from project_settings.
@@ -350,82 +638,39 @@ class ThreeMFAnalyzer:
     def _get_custom_global_settings(self) -> Dict[str, Any]:
         """Extract custom global settings"""
         custom = {}
+        ps = self.project_settings
+        ps_get = ps.get
         
-        diff_settings = self.project_settings.get('different_settings_to_system', [])
+        diff_settings = ps_get('different_settings_to_system', [])
         if diff_settings and diff_settings[0]:
-            # Filter empty strings that result from split on empty or ";;"
-            keys = [k.strip() for k in diff_settings[0].split(';') if k.strip()]
-            for key in keys:
-                if key in self.project_settings:
-                    value = self.project_settings[key]
-                    if isinstance(value, list) and len(value) == 1:
-                        value = value[0]
-                    custom[key] = value
+            # Strip each key once; empty entries come from "" or ";;"
+            for key in map(str.strip, diff_settings[0].split(';')):
+                if not key:
+                    continue
+                value = ps_get(key, _MISSING)
+                if value is _MISSING:
+                    continue
+                if isinstance(value, list) and len(value) == 1:
+                    value = value[0]
+                custom[key] = value
         
         return custom
     
     def _get_profile_info(self) -> Dict[str, Any]:
         """Extract profile information"""
-        return {
-            'printer': self.project_settings.get('printer_settings_id', 'Unknown'),
-            'process': self.project_settings.get('print_settings_id', 'Unknown'),
-            'filaments': self.project_settings.get('filament_settings_id', ['Unknown']),
-            # Basic settings
-            'layer_height': self._get_value('layer_height', ''),
-            'initial_layer_print_height': self._get_value('initial_layer_print_height', ''),
-            'nozzle': self._get_value('nozzle_diameter', ''),
-            'line_width': self._get_value('line_width', ''),
-            'wall_loops': self._get_value('wall_loops', ''),
-            'sparse_infill_density': self._get_value('sparse_infill_density', ''),
-            'brim_type': self._get_value('brim_type', ''),
-            'enable_support': self._get_value('enable_support', ''),
-            # Flow
-            'print_flow_ratio': self._get_value('print_flow_ratio', ''),
-            'filament_flow_ratio': self._get_value('filament_flow_ratio', ''),
-            # Speeds
-            'initial_layer_speed': self._get_value('initial_layer_speed', ''),
-            'outer_wall_speed': self._get_value('outer_wall_speed', ''),
-            'inner_wall_speed': self._get_value('inner_wall_speed', ''),
-            'sparse_infill_speed': self._get_value('sparse_infill_speed', ''),
-            'top_surface_speed': self._get_value('top_surface_speed', ''),
-            'travel_speed': self._get_value('travel_speed', ''),
-            'bridge_speed': self._get_value('bridge_speed', ''),
-            # Shells
-            'top_shell_layers': self._get_value('top_shell_layers', ''),
-            'bottom_shell_layers': self._get_value('bottom_shell_layers', ''),
-            # Seams
-            'seam_position': self._get_value('seam_position', ''),
-            # === Extended settings ===
-            # Patterns
-            'sparse_infill_pattern': self._get_value('sparse_infill_pattern', ''),
-            'top_surface_pattern': self._get_value('top_surface_pattern', ''),
-            # Special modes
-            'ironing_type': self._get_value('ironing_type', ''),
-            'fuzzy_skin': self._get_value('fuzzy_skin', ''),
-            'spiral_mode': self._get_value('spiral_mode', ''),
-            # Retraction and Z
-            'retraction_length': self._get_value('retraction_length', ''),
-            'retraction_speed': self._get_value('retraction_speed', ''),
-            'z_hop': self._get_value('z_hop', ''),
-            # Fan
-            'fan_min_speed': self._get_value('fan_min_speed', ''),
-            'fan_max_speed': self._get_value('fan_max_speed', ''),
-            # Cooling
-            'slow_down_for_layer_cooling': self._get_value('slow_down_for_layer_cooling', ''),
-            'slow_down_layer_time': self._get_value('slow_down_layer_time', ''),
-            # Advanced
-            'pressure_advance': self._get_value('pressure_advance', ''),
-            'enable_arc_fitting': self._get_value('enable_arc_fitting', ''),
-            'enable_overhang_speed': self._get_value('enable_overhang_speed', ''),
-            # Print modes
-            'print_sequence': self._get_value('print_sequence', ''),
-            'timelapse_type': self._get_value('timelapse_type', ''),
-            # Supports
-            'support_type': self._get_value('support_type', ''),
-            # Temperatures
-            'nozzle_temperature': self._get_value('nozzle_temperature', ''),
-            'bed_temperature': self._get_value('hot_plate_temp', ''),
+        ps = self.project_settings
+        profile = {
+            'printer': ps.get('printer_settings_id', 'Unknown'),
+            'process': ps.get('print_settings_id', 'Unknown'),
+            'filaments': ps.get('filament_settings_id', ['Unknown']),
         }
+        # Single pass over PROFILE_FIELDS (inlined _get_value(key, '') logic)
+        for name, key in PROFILE_FIELDS:
+            val = ps.get(key, '')
+            if type(val) is list:
+                val = val[0] if val else ''
+            profile[name] = val
+        return profile
     
     def _format_brim(self, brim_type: str) -> str:
         if not brim_type:
@@ -449,88 +694,99 @@ class ThreeMFAnalyzer:
         """Build the result"""
         profile = self._get_profile_info()
         
+        # Hoist per-file lookups out of the row loops
+        prof_layer = profile['layer_height']
+        prof_walls = profile['wall_loops']
+        prof_infill = profile['sparse_infill_density']
+        prof_support = profile['enable_support']
+        prof_brim = profile['brim_type']
+        prof_speed = profile['outer_wall_speed']
+        objects_get = self.objects.get
+        format_infill = self._format_infill
+        format_brim = self._format_brim
+        
         rows = []
+        add_row = rows.append
+        object_row = _OBJECT_ROW_TEMPLATE.copy
+        part_row = _PART_ROW_TEMPLATE.copy
         
         for plate in self.plates:
             plate_num = plate['id']
             
             for obj_id in plate['objects']:
-                obj = self.objects.get(obj_id, {})
-                obj_name = obj.get('name', f'Object {obj_id}')
+                obj = objects_get(obj_id)
+                if obj is None:
+                    # Plate references an object missing from model_settings
+                    obj = _ObjectRecord()
+                    obj.name = f'Object {obj_id}'
+                obj_name = obj.name
+                
+                own_layer = obj.layer_height
+                own_walls = obj.wall_loops
+                own_infill = obj.sparse_infill_density
+                own_support = obj.enable_support
+                own_brim = obj.brim_type
+                own_speed = obj.outer_wall_speed
                 
-                obj_layer = obj.get('layer_height') or profile['layer_height']
-                obj_walls = obj.get('wall_loops') or profile['wall_loops']
-                obj_infill = obj.get('sparse_infill_density') or profile['sparse_infill_density']
-                obj_support = obj.get('enable_support') or profile['enable_support']
-                obj_brim = obj.get('brim_type') or profile['brim_type']
-                obj_speed = obj.get('outer_wall_speed') or profile['outer_wall_speed']
-                obj_extruder = obj.get('extruder', DEFAULT_EXTRUDER)
+                obj_walls = own_walls or prof_walls
+                obj_infill = own_infill or prof_infill
+                obj_support = 'On' if (own_support or prof_support) == BOOL_TRUE else 'Off'
+                obj_speed = own_speed or prof_speed
+                obj_extruder = obj.extruder
                 
-                rows.append({
-                    'plate': plate_num,
-                    'name': obj_name,
-                    'is_parent': True,
-                    'is_part': False,
-                    'filament': obj_extruder,
-                    'layer_height': obj_layer,
-                    'layer_custom': _is_custom(obj.get('layer_height'), profile['layer_height']),
-                    'wall_loops': obj_walls,
-                    'walls_custom': _is_custom(obj.get('wall_loops'), profile['wall_loops']),
-                    'infill': self._format_infill(obj_infill),
-                    'infill_custom': _is_custom(obj.get('sparse_infill_density'), profile['sparse_infill_density']),
-                    'support': 'On' if obj_support == BOOL_TRUE else 'Off',
-                    'support_custom': _is_custom(obj.get('enable_support'), profile['enable_support']),
-                    'brim': self._format_brim(obj_brim),
-                    'brim_custom': _is_custom(obj.get('brim_type'), profile['brim_type']),
-                    'outer_wall_speed': obj_speed,
-                    'speed_custom': _is_custom(obj.get('outer_wall_speed'), profile['outer_wall_speed']),
-                    'custom_settings': obj.get('custom_settings', {}),
-                })
+                row = object_row()
+                row['plate'] = plate_num
+                row['name'] = obj_name
+                row['filament'] = obj_extruder
+                row['layer_height'] = own_layer or prof_layer
+                row['layer_custom'] = _is_custom(own_layer, prof_layer)
+                row['wall_loops'] = obj_walls
+                row['walls_custom'] = _is_custom(own_walls, prof_walls)
+                row['infill'] = format_infill(obj_infill)
+                row['infill_custom'] = _is_custom(own_infill, prof_infill)
+                row['support'] = obj_support
+                row['support_custom'] = _is_custom(own_support, prof_support)
+                row['brim'] = format_brim(own_brim or prof_brim)
+                row['brim_custom'] = _is_custom(own_brim, prof_brim)
+                row['outer_wall_speed'] = obj_speed
+                row['speed_custom'] = _is_custom(own_speed, prof_speed)
+                row['custom_settings'] = obj.custom_settings
+                add_row(row)
                 
                 # Parts (inherit values from parent object like slicer does)
                 # Skip parts if there's only one part with the same name as the object
-                parts = obj.get('parts', [])
-                if len(parts) == 1 and parts[0].get('name', 'Part') == obj_name:
+                parts = obj.parts
+                if len(parts) == 1 and parts[0].name == obj_name:
                     continue  # Don't duplicate single part with same name as object
                     
                 for part in parts:
-                    part_name = part.get('name', 'Part')
-                    part_extruder = part.get('extruder') or obj_extruder
-                    part_custom = part.get('custom_settings', {})
+                    part_name = part.name
+                    part_extruder = part.extruder or obj_extruder
+                    part_custom = part.custom_settings
+                    part_custom_get = part_custom.get
                     
                     # Check for part-specific overrides (use part's custom value or inherit from parent)
-                    part_infill = part_custom.get('sparse_infill_density') or part_custom.get('skeleton_infill_density') or obj_infill
-                    part_infill_custom = any(k in part_custom for k in INFILL_DENSITY_KEYS)
+                    part_infill = part_custom_get('sparse_infill_density') or part_custom_get('skeleton_infill_density') or obj_infill
+                    part_infill_custom = not INFILL_DENSITY_KEYS.isdisjoint(part_custom)
                     
-                    part_walls = part_custom.get('wall_loops') or obj_walls
+                    part_walls = part_custom_get('wall_loops') or obj_walls
                     part_walls_custom = 'wall_loops' in part_custom
                     
-                    part_speed = part_custom.get('outer_wall_speed') or obj_speed
+                    part_speed = part_custom_get('outer_wall_speed') or obj_speed
                     part_speed_custom = 'outer_wall_speed' in part_custom
                     
-                    # Inherit support from parent
-                    part_support = 'On' if obj_support == BOOL_TRUE else 'Off'
-                    
-                    rows.append({
-                        'plate': '',
-                        'name': f"  {part_name}",
-                        'is_parent': False,
-                        'is_part': True,
-                        'filament': part_extruder,
-                        'layer_height': '',
-                        'layer_custom': False,
-                        'wall_loops': part_walls,
-                        'walls_custom': part_walls_custom,
-                        'infill': self._format_infill(part_infill),
-                        'infill_custom': part_infill_custom,
-                        'support': part_support,
-                        'support_custom': False,
-                        'brim': '',
-                        'brim_custom': False,
-                        'outer_wall_speed': part_speed,
-                        'speed_custom': part_speed_custom,
-                        'custom_settings': part_custom,
-                    })
+                    row = part_row()
+                    row['name'] = f"  {part_name}"
+                    row['filament'] = part_extruder
+                    row['wall_loops'] = part_walls
+                    row['walls_custom'] = part_walls_custom
+                    row['infill'] = format_infill(part_infill)
+                    row['infill_custom'] = part_infill_custom
+                    row['support'] = obj_support  # Inherit support from parent
+                    row['outer_wall_speed'] = part_speed
+                    row['speed_custom'] = part_speed_custom
+                    row['custom_settings'] = part_custom
+                    add_row(row)
         
         return {
             'file': str(self.filepath.name),
@@ -541,15 +797,165 @@ class ThreeMFAnalyzer:
         }
 
 
+def _analyze_one(filepath: Union[str, Path]) -> Dict[str, Any]:
+    """Analyze a single file (module-level so worker processes can pickle it)."""
+    return ThreeMFAnalyzer(filepath).analyze()
+
+
+def analyze_many(filepaths: Iterable[Union[str, Path]],
+                 max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Analyze several 3MF files in parallel worker processes.
+    
+    Files are independent, so parsing fans out across CPUs. A single file
+    is analyzed in-process to avoid the pool start-up cost.
+    
+    Args:
+        filepaths: Paths to 3MF files.
+        max_workers: Number of worker processes (default: CPU count).
+    
+    Returns:
+        Result dicts in the same order as filepaths.
+    
+    Raises:
+        Any exception raised by ThreeMFAnalyzer.analyze() for the first failing file.
+    """
+    paths = list(filepaths)
+    if len(paths) <= 1:
+        return [_analyze_one(p) for p in paths]
+    # Imported here: the process pool machinery is only needed for batches
+    from concurrent.futures import ProcessPoolExecutor
+    
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_analyze_one, paths, chunksize=chunksize))
+
+
+# ═══════════════════════════════════════════════════════════════
+# Result Cache
+# ═══════════════════════════════════════════════════════════════
+
+def _get_cache_dir() -> Path:
+    """Get result cache directory ($THREEMF_ANALYZER_CACHE_DIR or XDG cache)."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / '3mf-settings-analyzer'
+
+
+def _cache_path(filepath: Path) -> Path:
+    """Build the cache file path for a 3MF file.
+    
+    The key covers the resolved path, mtime and size of the file, plus the
+    analyzer version and _CACHE_SCHEMA so that format changes invalidate
+    old entries.
+    
+    Raises:
+        OSError: If the file cannot be stat'ed.
+    """
+    st = filepath.stat()
+    key = f"{__version__}|{_CACHE_SCHEMA}|{filepath.resolve()}|{st.st_mtime_ns}|{st.st_size}"
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    return _get_cache_dir() / f"{digest}.json"
+
+
+def _write_cache(cache_path: Path, result: Dict[str, Any]) -> None:
+    """Write a result to the cache atomically; failures are only logged."""
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode='wb', dir=cache_path.parent, delete=False, suffix='.tmp'
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            tmp.write(_dumps_json(result))
+        tmp_path.replace(cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Failed to write result cache %s: %s", cache_path, e)
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        return
+    _prune_cache(cache_path.parent, CACHE_MAX_ENTRIES)
+
+
+def _prune_cache(cache_dir: Path, max_entries: int) -> None:
+    """Delete the least recently written cache entries beyond max_entries."""
+    try:
+        entries = []
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith('.json'):
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+    except OSError as e:
+        logger.debug("Failed to scan result cache %s: %s", cache_dir, e)
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def analyze_cached(filepath: Union[str, Path], use_cache: bool = True,
+                   parse_model: bool = True) -> Dict[str, Any]:
+    """Analyze a 3MF file, reusing the cached result if the file is unchanged.
+    
+    Args:
+        filepath: Path to the 3MF file.
+        use_cache: If False, always analyze and leave the cache untouched.
+        parse_model: If False, skip per-object settings (rows is empty).
+            A cached full result is still reused, but a profile-only result
+            is never written to the cache.
+    
+    Returns:
+        The same result dict as ThreeMFAnalyzer.analyze().
+    """
+    filepath = Path(filepath)
+    if not use_cache:
+        return ThreeMFAnalyzer(filepath).analyze(parse_model)
+    
+    try:
+        cache_path = _cache_path(filepath)
+    except OSError:
+        # Let the analyzer report the missing/unreadable file
+        return ThreeMFAnalyzer(filepath).analyze(parse_model)
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            result = _loads_json(f.read())
+        logger.debug("Using cached result: %s", cache_path)
+        # The key uses the resolved path, so the entry may have been written
+        # through another name (e.g. a symlink); report the name given here
+        result['file'] = filepath.name
+        if not parse_model:
+            result['rows'] = []
+        return result
+    except FileNotFoundError:
+        pass
+    except (OSError, json.JSONDecodeError) as e:
+        logger.debug("Ignoring unreadable result cache %s: %s", cache_path, e)
+    
+    result = ThreeMFAnalyzer(filepath).analyze(parse_model)
+    if parse_model:
+        _write_cache(cache_path, result)
+    return result
+
+
 # ═══════════════════════════════════════════════════════════════
 # Output
 # ═══════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=None)
 def _make_wiki_helpers(enabled: bool) -> Tuple[Callable[[str, str], str], Callable[[str], str]]:
     """Create wiki_label and wiki_key helpers based on --wiki flag.
 
     When disabled, returns no-op passthrough functions to avoid
-    importing settings_wiki module entirely.
+    importing settings_wiki module entirely. When enabled, the helpers
+    are memoized: the set of setting keys is small and fixed, so repeated
+    labels (and repeated print_results calls) reuse the built markup.
     
     Returns:
         Tuple of (wiki_label, wiki_key) callable functions.
@@ -561,7 +967,7 @@ def _make_wiki_helpers(enabled: bool) -> Tuple[Callable[[str, str], str], Callab
         )
 
     try:
-        from settings_wiki import get_wiki_url
+        from settings_wiki import get_wiki_url as _get_wiki_url
     except ImportError as e:
         logger.warning("Wiki module unavailable: %s. Wiki links disabled.", e)
         return (
@@ -570,6 +976,10 @@ def _make_wiki_helpers(enabled: bool) -> Tuple[Callable[[str, str], str], Callab
         )
     from rich.markup import escape
 
+    # Shared by both helpers: labels and keys resolve the same setting URLs
+    get_wiki_url = lru_cache(maxsize=None)(_get_wiki_url)
+
+    @lru_cache(maxsize=None)
     def wiki_label(display_name: str, setting_key: str) -> str:
         """Wrap display_name in a Rich hyperlink to the OrcaSlicer wiki page."""
         url = get_wiki_url(setting_key)
@@ -578,6 +988,7 @@ def _make_wiki_helpers(enabled: bool) -> Tuple[Callable[[str, str], str], Callab
             return f"[link={url}]{safe_name}[/link]"
         return safe_name
 
+    @lru_cache(maxsize=None)
     def wiki_key(setting_key: str) -> str:
         """Wrap a raw setting key in a Rich hyperlink to the wiki page."""
         url = get_wiki_url(setting_key)
@@ -589,95 +1000,115 @@ def _make_wiki_helpers(enabled: bool) -> Tuple[Callable[[str, str], str], Callab
     return wiki_label, wiki_key
 
 
-def _print_header(console: Console, filename: str):
-    console.print(Panel(f"[bold cyan]3MF SETTINGS ANALYZER[/bold cyan]  │  {filename}", 
-                        border_style="cyan"))
+def _header_panel(filename: str) -> 'Panel':
+    from rich.panel import Panel
+    
+    return Panel(f"[bold cyan]3MF SETTINGS ANALYZER[/bold cyan]  │  {filename}", 
+                 border_style="cyan")
+
 
+def _profile_rows(profile: Dict[str, Any]) -> List[Tuple[str, Any, str]]:
+    """Build PROFILE rows as (label, value, style) tuples."""
+    rows = [
+        ("Printer", profile['printer'], "white"),
+        ("Process", profile['process'], "green"),
+    ]
+    filaments = profile['filaments']
+    if isinstance(filaments, list):
+        for i, f in enumerate(filaments):
+            rows.append((f"Filament {i+1}", f, "magenta"))
+    return rows
 
-def _print_profile_panel(console: Console, profile: Dict[str, Any]):
+
+def _profile_panel(profile: Dict[str, Any]) -> 'Panel':
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    
     profile_table = Table(show_header=False, box=None, padding=(0, 2))
     profile_table.add_column("Key", style="dim")
     profile_table.add_column("Value")
     
-    profile_table.add_row("Printer", f"[white]{profile['printer']}[/white]")
-    profile_table.add_row("Process", f"[green]{profile['process']}[/green]")
+    for label, value, style in _profile_rows(profile):
+        profile_table.add_row(label, Text.assemble((str(value), style)))
     
-    filaments = profile['filaments']
-    if isinstance(filaments, list):
-        for i, f in enumerate(filaments):
-            profile_table.add_row(f"Filament {i+1}", f"[magenta]{f}[/magenta]")
-    
-    console.print(Panel(profile_table, title="[bold bright_yellow]PROFILE[/bold bright_yellow]",
-                        border_style="grey50", box=box.ROUNDED))
+    return Panel(profile_table, title="[bold bright_yellow]PROFILE[/bold bright_yellow]",
+                 border_style="grey50", box=box.ROUNDED)
 
 
-def _print_global_settings(console: Console, profile: Dict[str, Any], wiki_label):
-    gs = Table(show_header=False, box=None, padding=(0, 2))
-    gs.add_column("Key", style="dim")
-    gs.add_column("Value", style="white")
+def _global_settings_rows(profile: Dict[str, Any]) -> List[Tuple[str, Optional[str], Any, Optional[str]]]:
+    """Build GLOBAL SETTINGS rows as (display_name, setting_key, value, style) tuples.
+    
+    Rows with an empty display_name separate groups. setting_key is used for
+    wiki links (None for rows without a wiki page); style is an optional
+    Rich style for the value.
+    """
+    rows = []
+    add = rows.append
     
     # -- Basic --
-    gs.add_row(wiki_label("Layer Height", "layer_height"), f"{profile['layer_height']} mm")
+    add(("Layer Height", "layer_height", f"{profile['layer_height']} mm", None))
     if profile['initial_layer_print_height']:
-        gs.add_row(wiki_label("Initial Layer Print Height", "initial_layer_print_height"), f"{profile['initial_layer_print_height']} mm")
+        add(("Initial Layer Print Height", "initial_layer_print_height", f"{profile['initial_layer_print_height']} mm", None))
     if profile['line_width']:
-        gs.add_row(wiki_label("Line Width", "line_width"), f"{profile['line_width']} mm")
+        add(("Line Width", "line_width", f"{profile['line_width']} mm", None))
     if profile['print_flow_ratio'] and profile['print_flow_ratio'] != '1':
-        gs.add_row(wiki_label("Print Flow Ratio", "print_flow_ratio"), f"{float(profile['print_flow_ratio'])*100:.0f}%")
+        add(("Print Flow Ratio", "print_flow_ratio", f"{float(profile['print_flow_ratio'])*100:.0f}%", None))
     elif profile['filament_flow_ratio']:
-        gs.add_row(wiki_label("Filament Flow Ratio", "filament_flow_ratio"), profile['filament_flow_ratio'])
-    gs.add_row(wiki_label("Wall Loops", "wall_loops"), profile['wall_loops'])
-    gs.add_row(wiki_label("Sparse Infill Density", "sparse_infill_density"), profile['sparse_infill_density'])
-    gs.add_row(wiki_label("Top/Bottom Shell Layers", "top_shell_layers"), f"{profile['top_shell_layers']}/{profile['bottom_shell_layers']}")
-    gs.add_row(wiki_label("Brim Type", "brim_type"), profile['brim_type'])
-    gs.add_row(wiki_label("Enable Support", "enable_support"), "On" if profile['enable_support'] == BOOL_TRUE else "Off")
-    gs.add_row(wiki_label("Seam Position", "seam_position"), profile['seam_position'])
+        add(("Filament Flow Ratio", "filament_flow_ratio", profile['filament_flow_ratio'], None))
+    add(("Wall Loops", "wall_loops", profile['wall_loops'], None))
+    add(("Sparse Infill Density", "sparse_infill_density", profile['sparse_infill_density'], None))
+    add(("Top/Bottom Shell Layers", "top_shell_layers", f"{profile['top_shell_layers']}/{profile['bottom_shell_layers']}", None))
+    add(("Brim Type", "brim_type", profile['brim_type'], None))
+    add(("Enable Support", "enable_support", "On" if profile['enable_support'] == BOOL_TRUE else "Off", None))
+    add(("Seam Position", "seam_position", profile['seam_position'], None))
     
     # -- Speeds --
-    gs.add_row("", "")
+    add(("", None, "", None))
     if profile['initial_layer_speed']:
-        gs.add_row(wiki_label("Initial Layer Speed", "initial_layer_speed"), f"[cyan]{profile['initial_layer_speed']} mm/s[/cyan]")
-    gs.add_row(wiki_label("Outer Wall Speed", "outer_wall_speed"), f"[cyan]{profile['outer_wall_speed']} mm/s[/cyan]")
-    gs.add_row(wiki_label("Inner Wall Speed", "inner_wall_speed"), f"[cyan]{profile['inner_wall_speed']} mm/s[/cyan]")
+        add(("Initial Layer Speed", "initial_layer_speed", f"{profile['initial_layer_speed']} mm/s", "cyan"))
+    add(("Outer Wall Speed", "outer_wall_speed", f"{profile['outer_wall_speed']} mm/s", "cyan"))
+    add(("Inner Wall Speed", "inner_wall_speed", f"{profile['inner_wall_speed']} mm/s", "cyan"))
     if profile['sparse_infill_speed']:
-        gs.add_row(wiki_label("Sparse Infill Speed", "sparse_infill_speed"), f"[cyan]{profile['sparse_infill_speed']} mm/s[/cyan]")
+        add(("Sparse Infill Speed", "sparse_infill_speed", f"{profile['sparse_infill_speed']} mm/s", "cyan"))
     if profile['top_surface_speed']:
-        gs.add_row(wiki_label("Top Surface Speed", "top_surface_speed"), f"[cyan]{profile['top_surface_speed']} mm/s[/cyan]")
-    gs.add_row(wiki_label("Travel Speed", "travel_speed"), f"[cyan]{profile['travel_speed']} mm/s[/cyan]")
-    gs.add_row(wiki_label("Bridge Speed", "bridge_speed"), f"[cyan]{profile['bridge_speed']} mm/s[/cyan]")
+        add(("Top Surface Speed", "top_surface_speed", f"{profile['top_surface_speed']} mm/s", "cyan"))
+    add(("Travel Speed", "travel_speed", f"{profile['travel_speed']} mm/s", "cyan"))
+    add(("Bridge Speed", "bridge_speed", f"{profile['bridge_speed']} mm/s", "cyan"))
     
     # -- Patterns --
-    gs.add_row("", "")
-    gs.add_row(wiki_label("Sparse Infill Pattern", "sparse_infill_pattern"), profile['sparse_infill_pattern'])
-    gs.add_row(wiki_label("Top Surface Pattern", "top_surface_pattern"), profile['top_surface_pattern'])
-    gs.add_row(wiki_label("Print Sequence", "print_sequence"), profile['print_sequence'])
+    add(("", None, "", None))
+    add(("Sparse Infill Pattern", "sparse_infill_pattern", profile['sparse_infill_pattern'], None))
+    add(("Top Surface Pattern", "top_surface_pattern", profile['top_surface_pattern'], None))
+    add(("Print Sequence", "print_sequence", profile['print_sequence'], None))
     if profile['spiral_mode'] == BOOL_TRUE:
-        gs.add_row(wiki_label("Spiral Mode (Vase)", "spiral_mode"), "[bright_green]ON[/bright_green]")
+        add(("Spiral Mode (Vase)", "spiral_mode", "ON", "bright_green"))
     if profile['ironing_type'] and profile['ironing_type'] not in ('no ironing', 'no_ironing'):
-        gs.add_row(wiki_label("Ironing Type", "ironing_type"), f"[bright_green]{profile['ironing_type']}[/bright_green]")
+        add(("Ironing Type", "ironing_type", profile['ironing_type'], "bright_green"))
     if profile['fuzzy_skin'] and profile['fuzzy_skin'] != 'none':
-        gs.add_row(wiki_label("Fuzzy Skin", "fuzzy_skin"), f"[bright_green]{profile['fuzzy_skin']}[/bright_green]")
+        add(("Fuzzy Skin", "fuzzy_skin", profile['fuzzy_skin'], "bright_green"))
     
     # -- Retraction / Z-hop / PA / Fan / Cooling --
-    gs.add_row("", "")
-    gs.add_row(wiki_label("Retraction Length", "retraction_length"), f"{profile['retraction_length']} mm")
+    add(("", None, "", None))
+    add(("Retraction Length", "retraction_length", f"{profile['retraction_length']} mm", None))
     if profile['retraction_speed']:
-        gs.add_row(wiki_label("Retraction Speed", "retraction_speed"), f"{profile['retraction_speed']} mm/s")
-    gs.add_row(wiki_label("Z-Hop", "z_hop"), f"{profile['z_hop']} mm")
+        add(("Retraction Speed", "retraction_speed", f"{profile['retraction_speed']} mm/s", None))
+    add(("Z-Hop", "z_hop", f"{profile['z_hop']} mm", None))
     if profile['pressure_advance']:
-        gs.add_row(wiki_label("Pressure Advance", "pressure_advance"), profile['pressure_advance'])
+        add(("Pressure Advance", "pressure_advance", profile['pressure_advance'], None))
     if profile['fan_min_speed'] or profile['fan_max_speed']:
-        gs.add_row(wiki_label("Fan Min/Max Speed", "fan_min_speed"), f"{profile['fan_min_speed']}% / {profile['fan_max_speed']}%")
+        add(("Fan Min/Max Speed", "fan_min_speed", f"{profile['fan_min_speed']}% / {profile['fan_max_speed']}%", None))
     if profile['slow_down_for_layer_cooling'] == BOOL_TRUE:
-        gs.add_row(wiki_label("Slow Down for Layer Cooling", "slow_down_for_layer_cooling"), f"[green]On[/green] ({profile['slow_down_layer_time']}s)")
+        add(("Slow Down for Layer Cooling", "slow_down_for_layer_cooling", f"On ({profile['slow_down_layer_time']}s)", "green"))
     elif profile['slow_down_for_layer_cooling']:
-        gs.add_row(wiki_label("Slow Down for Layer Cooling", "slow_down_for_layer_cooling"), "[dim]Off[/dim]")
+        add(("Slow Down for Layer Cooling", "slow_down_for_layer_cooling", "Off", "dim"))
     
     # -- Temperatures --
-    gs.add_row("", "")
-    gs.add_row(wiki_label("Nozzle Temperature", "nozzle_temperature"), f"[red]{profile['nozzle_temperature']}°C[/red]")
+    add(("", None, "", None))
+    add(("Nozzle Temperature", "nozzle_temperature", f"{profile['nozzle_temperature']}°C", "red"))
     if profile['bed_temperature']:
-        gs.add_row(wiki_label("Bed Temperature", "bed_temperature"), f"[red]{profile['bed_temperature']}°C[/red]")
+        add(("Bed Temperature", "bed_temperature", f"{profile['bed_temperature']}°C", "red"))
     
     # -- Features --
     flags = []
@@ -688,27 +1119,56 @@ def _print_global_settings(console: Console, profile: Dict[str, Any], wiki_label
     if profile['timelapse_type'] and profile['timelapse_type'] != '0':
         flags.append(f"Timelapse Type: {profile['timelapse_type']}")
     if flags:
-        gs.add_row("", "")
-        gs.add_row("[dim]Features[/dim]", f"[bright_cyan]{', '.join(flags)}[/bright_cyan]")
+        add(("", None, "", None))
+        add(("Features", None, ', '.join(flags), "bright_cyan"))
+    
+    return rows
+
+
+def _global_settings_panel(profile: Dict[str, Any], wiki_label) -> 'Panel':
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    
+    gs = Table(show_header=False, box=None, padding=(0, 2))
+    gs.add_column("Key", style="dim")
+    gs.add_column("Value", style="white")
+    add_row = gs.add_row
+    
+    for display_name, setting_key, value, style in _global_settings_rows(profile):
+        if setting_key:
+            label = wiki_label(display_name, setting_key)
+        else:
+            label = f"[dim]{display_name}[/dim]" if display_name else display_name
+        # Values are Text spans, so Rich doesn't parse them as markup
+        add_row(label, Text.assemble((str(value), style or "")))
     
-    console.print(Panel(gs, title="[bold bright_yellow]GLOBAL SETTINGS[/bold bright_yellow]",
-                        border_style="grey50", box=box.ROUNDED))
+    return Panel(gs, title="[bold bright_yellow]GLOBAL SETTINGS[/bold bright_yellow]",
+                 border_style="grey50", box=box.ROUNDED)
 
 
-def _print_custom_global(console: Console, custom: Dict[str, Any], wiki_key):
+def _custom_global_panel(custom: Dict[str, Any], wiki_key) -> Optional['Panel']:
     if not custom:
-        return
+        return None
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    
     custom_table = Table(show_header=False, box=None, padding=(0, 2))
     custom_table.add_column("Key", style="yellow")
     custom_table.add_column("Value", style="white")
+    add_row = custom_table.add_row
     for k, v in custom.items():
-        custom_table.add_row(f"✎ {wiki_key(k)}", escape(str(v)))
-    console.print(Panel(custom_table,
-                        title="[bold bright_red]CUSTOM GLOBAL SETTINGS[/bold bright_red] [grey50](changed from profile)[/grey50]",
-                        border_style="grey50", box=box.ROUNDED))
+        # Values are plain Text: no escaping or markup parsing needed
+        add_row(f"✎ {wiki_key(k)}", Text(str(v)))
+    return Panel(custom_table,
+                 title="[bold bright_red]CUSTOM GLOBAL SETTINGS[/bold bright_red] [grey50](changed from profile)[/grey50]",
+                 border_style="grey50", box=box.ROUNDED)
 
 
-def _format_object_value(val, is_custom: bool, default, show_diff: bool) -> str:
+def _format_object_value(val, is_custom: bool, default, show_diff: bool, plain: bool = False) -> str:
     """Format object setting value with optional custom/diff markers.
     
     Args:
@@ -716,6 +1176,7 @@ def _format_object_value(val, is_custom: bool, default, show_diff: bool) -> str:
         is_custom: Whether the value differs from profile default.
         default: The profile default value (shown in diff mode).
         show_diff: Whether to show the default value comparison.
+        plain: Return the markers without Rich markup.
         
     Returns:
         Formatted string with Rich markup for styling.
@@ -723,6 +1184,10 @@ def _format_object_value(val, is_custom: bool, default, show_diff: bool) -> str:
     if not val:
         return ""
     s = str(val)
+    if plain:
+        if not is_custom:
+            return s
+        return f"*{s} ←{default}" if default and show_diff else f"*{s}"
     if is_custom and default and show_diff:
         return f"[bold yellow]*{s}[/bold yellow] [dim]←{default}[/dim]"
     elif is_custom:
@@ -730,18 +1195,21 @@ def _format_object_value(val, is_custom: bool, default, show_diff: bool) -> str:
     return s
 
 
-def _format_support_value(support: str, is_custom: bool) -> str:
+def _format_support_value(support: str, is_custom: bool, plain: bool = False) -> str:
     """Format support enable/disable value with color coding.
     
     Args:
         support: Support status ('On', 'Off', or empty).
         is_custom: Whether the value differs from profile default.
+        plain: Return the value without Rich markup.
         
     Returns:
         Formatted string with Rich markup (green for On, dim for Off).
     """
     if support == '':
         return ""
+    elif plain:
+        return f"*{support}" if is_custom else support
     elif support == 'On':
         if is_custom:
             return "[bold yellow]*On[/bold yellow]"
@@ -752,101 +1220,239 @@ def _format_support_value(support: str, is_custom: bool) -> str:
         return "[dim]Off[/dim]"
 
 
-def _print_objects_table(console: Console, rows: List[Dict], profile: Dict[str, Any],
-                         profile_full: Dict[str, Any], show_diff: bool, wiki_key):
+def _make_objects_table() -> 'Table':
+    """Create an empty objects table with the OBJECT_COLUMN_SPECS columns."""
+    from rich import box
+    from rich.table import Table
+    
+    table = Table(box=box.ROUNDED, show_lines=False, header_style="bold blue", expand=True, border_style="grey50")
+    add_column = table.add_column
+    for header, options in OBJECT_COLUMN_SPECS:
+        add_column(header, **options)
+    return table
+
+
+@lru_cache(maxsize=256)
+def _plate_style(plate_num: str) -> str:
+    """Return the Rich style for a plate number cell."""
+    plate_idx = int(plate_num) - 1 if plate_num.isdigit() else 0
+    return f"bold {PLATE_COLORS[plate_idx % len(PLATE_COLORS)]}"
+
+
+@lru_cache(maxsize=256)
+def _filament_style(fil: str) -> str:
+    """Return the Rich style for a filament number cell."""
+    fil_num = int(fil) if fil.isdigit() else 0
+    return FILAMENT_COLORS[(fil_num - 1) % len(FILAMENT_COLORS)] if fil_num > 0 else 'white'
+
+
+def _objects_renderables(rows: List[Dict], profile: Dict[str, Any],
+                         profile_full: Dict[str, Any], show_diff: bool, wiki_key) -> List[Any]:
+    """Build the OBJECTS rule, table and legend as Rich renderables."""
     if not rows:
-        console.print("\n[red]No objects found[/red]")
-        return
+        return ["\n[red]No objects found[/red]"]
+    from rich.rule import Rule
+    from rich.text import Text
     
-    console.rule("[bold bright_yellow]OBJECTS[/bold bright_yellow]", style="grey50")
+    rule = Rule("[bold bright_yellow]OBJECTS[/bold bright_yellow]", style="grey50")
     
-    table = Table(box=box.ROUNDED, show_lines=False, header_style="bold blue", expand=True, border_style="grey50")
-    table.add_column("Plate", justify="center", style="white", width=5)
-    table.add_column("Name", style="white", min_width=20, max_width=50)
-    table.add_column("Filament", justify="center", width=8)
-    table.add_column("Layer Height", justify="center")
-    table.add_column("Wall Loops", justify="center")
-    table.add_column("Infill Density", justify="center")
-    table.add_column("Support", justify="center", width=7)
-    table.add_column("Brim Type", justify="center")
-    table.add_column("Outer Wall Speed", justify="center")
+    table = _make_objects_table()
+    
+    # Hoist per-table lookups out of the row loop
+    def_layer = profile['layer_height']
+    def_walls = profile['wall_loops']
+    def_infill = profile['sparse_infill_density']
+    def_brim = profile['brim_type']
+    def_speed = profile['outer_wall_speed']
+    full_get = profile_full.get
+    fmt = _format_object_value
+    add_row = table.add_row
+    add_section = table.add_section
     
     current_plate = None
     for row in rows:
-        plate_num = str(row['plate']) if row['plate'] else ""
-        name = row['name']
-        fil = row['filament']
+        (plate, name, is_parent, fil,
+         layer, layer_custom, walls, walls_custom,
+         infill, infill_custom, support, support_custom,
+         brim, brim_custom, speed, speed_custom) = _row_fields(row)
+        plate_num = str(plate) if plate else ""
         
         # Separators
-        if row['is_parent'] and current_plate is not None:
+        if is_parent and current_plate is not None:
             if plate_num and plate_num != current_plate:
-                table.add_section()
-                table.add_section()
+                add_section()
+                add_section()
             else:
-                table.add_section()
+                add_section()
         if plate_num:
             current_plate = plate_num
         
-        # Plate number with distinct color
-        if plate_num:
-            plate_idx = int(plate_num) - 1 if plate_num.isdigit() else 0
-            plate_color = PLATE_COLORS[plate_idx % len(PLATE_COLORS)]
-            plate_styled = f"[bold {plate_color}]{plate_num}[/bold {plate_color}]"
-        else:
-            plate_styled = ""
-        
-        # Filament color by number
-        fil_num = int(fil) if fil.isdigit() else 0
-        fil_color = FILAMENT_COLORS[(fil_num - 1) % len(FILAMENT_COLORS)] if fil_num > 0 else 'white'
-        fil_styled = f"[{fil_color}]{fil}[/{fil_color}]" if fil else ""
-        
-        layer = _format_object_value(row['layer_height'], row['layer_custom'], profile['layer_height'], show_diff)
-        walls = _format_object_value(row['wall_loops'], row['walls_custom'], profile['wall_loops'], show_diff)
-        infill = _format_object_value(row['infill'], row['infill_custom'], profile['sparse_infill_density'], show_diff)
-        support = _format_support_value(row['support'], row['support_custom'])
-        brim = _format_object_value(row['brim'], row['brim_custom'], profile['brim_type'], show_diff)
-        speed = _format_object_value(row['outer_wall_speed'], row['speed_custom'], profile['outer_wall_speed'], show_diff)
-        
-        # Name style
-        if row['is_parent']:
-            name_style = "[bold white]" + name + "[/bold white]"
-        else:
-            name_style = "[dim]" + name + "[/dim]"
+        layer = fmt(layer, layer_custom, def_layer, show_diff)
+        walls = fmt(walls, walls_custom, def_walls, show_diff)
+        infill = fmt(infill, infill_custom, def_infill, show_diff)
+        support = _format_support_value(support, support_custom)
+        brim = fmt(brim, brim_custom, def_brim, show_diff)
+        speed = fmt(speed, speed_custom, def_speed, show_diff)
+        
+        # Styled Text cells skip Rich's markup parser
+        plate_cell = Text.assemble((plate_num, _plate_style(plate_num))) if plate_num else ""
+        fil_cell = Text.assemble((fil, _filament_style(fil))) if fil else ""
+        name_cell = Text.assemble((name, "bold white" if is_parent else "dim"))
         
-        table.add_row(plate_styled, name_style, fil_styled, layer, walls, infill, support, brim, speed)
+        add_row(plate_cell, name_cell, fil_cell, layer, walls, infill, support, brim, speed)
         
-        # Custom settings for object/part
-        custom_settings = row.get('custom_settings', {})
+        # Custom settings for object/part, as one multi-line cell in a single row
+        custom_settings = row.get('custom_settings')
+        if custom_settings:
+            last = len(custom_settings) - 1
+            setting_lines = []
+            for idx, (key, value) in enumerate(custom_settings.items()):
+                branch = "└─" if idx == last else "├─"
+                line = f"    [dim]{branch}[/dim] [yellow]{wiki_key(key)}: {value}[/yellow]"
+                if show_diff:
+                    default_val = full_get(key, '')
+                    if default_val and str(default_val) != str(value):
+                        line = f"{line} [dim]←{default_val}[/dim]"
+                setting_lines.append(line)
+            add_row("", "\n".join(setting_lines), *_EMPTY_TAIL_CELLS)
+
+    return [rule, table, "[bold yellow]*[/bold yellow] = custom value (overrides profile default)"]
+
+
+def _plain_section(title: str, rows: Iterable[Tuple[str, Any]]) -> List[str]:
+    """Render a titled two-column section as aligned plain-text lines."""
+    rows = list(rows)
+    width = max((len(k) for k, _ in rows), default=0)
+    lines = [title]
+    for key, value in rows:
+        lines.append(f"  {key:<{width}}  {value}".rstrip() if key or value != '' else "")
+    lines.append("")
+    return lines
+
+
+def _plain_objects_lines(rows: List[Dict], profile: Dict[str, Any],
+                         profile_full: Dict[str, Any], show_diff: bool) -> List[str]:
+    """Render the objects table as aligned plain-text lines."""
+    if not rows:
+        return ["No objects found"]
+    
+    def_layer = profile['layer_height']
+    def_walls = profile['wall_loops']
+    def_infill = profile['sparse_infill_density']
+    def_brim = profile['brim_type']
+    def_speed = profile['outer_wall_speed']
+    fmt = _format_object_value
+    table = []
+    current_plate = None
+    for row in rows:
+        (plate, name, is_parent, fil,
+         layer, layer_custom, walls, walls_custom,
+         infill, infill_custom, support, support_custom,
+         brim, brim_custom, speed, speed_custom) = _row_fields(row)
+        plate_num = str(plate) if plate else ""
+        if is_parent and current_plate is not None and plate_num and plate_num != current_plate:
+            table.append(None)
+        if plate_num:
+            current_plate = plate_num
+        table.append((
+            plate_num, name, fil,
+            fmt(layer, layer_custom, def_layer, show_diff, True),
+            fmt(walls, walls_custom, def_walls, show_diff, True),
+            fmt(infill, infill_custom, def_infill, show_diff, True),
+            _format_support_value(support, support_custom, True),
+            fmt(brim, brim_custom, def_brim, show_diff, True),
+            fmt(speed, speed_custom, def_speed, show_diff, True),
+        ))
+        custom_settings = row.get('custom_settings')
         if custom_settings:
-            settings_items = list(custom_settings.items())
-            for idx, (key, value) in enumerate(settings_items):
-                is_last = (idx == len(settings_items) - 1)
-                branch = "└─" if is_last else "├─"
+            last = len(custom_settings) - 1
+            for idx, (key, value) in enumerate(custom_settings.items()):
+                branch = "└─" if idx == last else "├─"
                 default_val = profile_full.get(key, '')
-                linked_key = wiki_key(key)
                 if show_diff and default_val and str(default_val) != str(value):
-                    setting_name = f"    [dim]{branch}[/dim] [yellow]{linked_key}: {value}[/yellow] [dim]←{default_val}[/dim]"
+                    table.append(f"  {branch} {key}: {value} ←{default_val}")
                 else:
-                    setting_name = f"    [dim]{branch}[/dim] [yellow]{linked_key}: {value}[/yellow]"
-                table.add_row("", setting_name, "", "", "", "", "", "", "")
+                    table.append(f"  {branch} {key}: {value}")
+    
+    widths = [len(h) for h in OBJECT_COLUMNS]
+    for cells in table:
+        if type(cells) is tuple:
+            for i, cell in enumerate(cells):
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+    
+    def join(cells) -> str:
+        return "  ".join(f"{c:<{w}}" for c, w in zip(cells, widths)).rstrip()
     
-    console.print(table)
-    console.print("[bold yellow]*[/bold yellow] = custom value (overrides profile default)")
-    print()
+    indent = " " * (widths[0] + 2)
+    lines = ["OBJECTS", join(OBJECT_COLUMNS), join("-" * w for w in widths)]
+    for cells in table:
+        if cells is None:
+            lines.append("")
+        elif type(cells) is tuple:
+            lines.append(join(cells))
+        else:
+            lines.append(indent + cells)
+    lines.append("")
+    lines.append("* = custom value (overrides profile default)")
+    return lines
 
 
-def print_results(result: Dict[str, Any], show_diff: bool = False, no_color: bool = False, wiki: bool = False):
-    """Format and display analysis results using Rich tables."""
+def _print_plain_results(result: Dict[str, Any], show_diff: bool = False, show_objects: bool = True):
+    """Write analysis results as plain text in a single write.
+    
+    Used when output is not a terminal or colors are disabled: skips Rich
+    layout and markup entirely, which keeps batch runs over many files cheap.
+    """
+    profile = result['profile']
+    lines = [f"3MF SETTINGS ANALYZER  |  {result['file']}", ""]
+    lines += _plain_section("PROFILE", ((label, value) for label, value, _ in _profile_rows(profile)))
+    lines += _plain_section("GLOBAL SETTINGS",
+                            ((name, value) for name, _, value, _ in _global_settings_rows(profile)))
+    custom = result['custom_global']
+    if custom:
+        lines += _plain_section("CUSTOM GLOBAL SETTINGS (changed from profile)",
+                                ((f"✎ {k}", v) for k, v in custom.items()))
+    if show_objects:
+        lines += _plain_objects_lines(result['rows'], profile, result.get('profile_full', {}), show_diff)
+        lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def print_results(result: Dict[str, Any], show_diff: bool = False, no_color: bool = False, wiki: bool = False,
+                  show_objects: bool = True):
+    """Format and display analysis results using Rich tables.
+    
+    Falls back to plain text when stdout is not a terminal or colors are
+    disabled; wiki links are terminal-only and are dropped in that case.
+    show_objects=False leaves out the OBJECTS section (profile-only mode).
+    """
+    console = None
+    if not no_color:
+        from rich.console import Console, Group
+        console = Console(emoji=False)
+    if console is None or not console.is_terminal:
+        _print_plain_results(result, show_diff, show_objects)
+        return
     wiki_label, wiki_key = _make_wiki_helpers(wiki)
-    console = Console(no_color=no_color)
     profile = result['profile']
     profile_full = result.get('profile_full', {})
     
-    _print_header(console, result['file'])
-    _print_profile_panel(console, profile)
-    _print_global_settings(console, profile, wiki_label)
-    _print_custom_global(console, result['custom_global'], wiki_key)
-    _print_objects_table(console, result['rows'], profile, profile_full, show_diff, wiki_key)
+    renderables = [
+        _header_panel(result['file']),
+        _profile_panel(profile),
+        _global_settings_panel(profile, wiki_label),
+    ]
+    custom_panel = _custom_global_panel(result['custom_global'], wiki_key)
+    if custom_panel is not None:
+        renderables.append(custom_panel)
+    if show_objects:
+        renderables += _objects_renderables(result['rows'], profile, profile_full, show_diff, wiki_key)
+        if result['rows']:
+            renderables.append("")
+    
+    # One print call renders and writes everything in a single pass
+    console.print(Group(*renderables))
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -870,6 +1476,8 @@ Examples:
   python analyze.py model.3mf --verbose
   python analyze.py model.3mf --wiki
   python analyze.py model.3mf --no-color > output.txt
+  python analyze.py model.3mf --no-cache
+  python analyze.py model.3mf --profile-only
   python analyze.py --update-wiki
 """
     )
@@ -882,6 +1490,10 @@ Examples:
                         help='Disable colored output (for Rich library)')
     parser.add_argument('--wiki', '-w', action='store_true',
                         help='Add clickable wiki links to setting names (Cmd/Ctrl+click)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-analyze the file instead of using cached results')
+    parser.add_argument('--profile-only', action='store_true',
+                        help='Show only profile and global settings (skips per-object parsing)')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose logging')
     parser.add_argument('--version', action='version',
@@ -898,7 +1510,8 @@ Examples:
     # Handle wiki update commands (no file required)
     if args.update_wiki or args.force_update_wiki:
         from settings_wiki import update as wiki_update
-        console = Console(no_color=args.no_color)
+        from rich.console import Console
+        console = Console(no_color=args.no_color, emoji=False)
         console.print("[cyan]Updating wiki data from OrcaSlicer GitHub...[/cyan]")
         try:
             updated = wiki_update(force=args.force_update_wiki)
@@ -919,22 +1532,29 @@ Examples:
     if filepath is None:
         parser.error("the following arguments are required: file")
     
-    if not filepath.exists():
-        logger.error("File not found: %s", filepath)
-        sys.exit(1)
-    
+    # No exists() pre-check: opening the file reports a missing path below
     if filepath.suffix.lower() != FILE_EXTENSION_3MF:
         logger.warning("File does not have .3mf extension: %s", filepath)
     
     try:
-        analyzer = ThreeMFAnalyzer(str(filepath))
-        result = analyzer.analyze()
+        result = analyze_cached(filepath, use_cache=not args.no_cache,
+                                parse_model=not args.profile_only)
         
         if args.json:
             # JSON-only output for scripting/automation
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+            # JSON is UTF-8 bytes already: write them to the binary buffer
+            # when there is one instead of decoding and re-encoding
+            data = _dumps_json(result, indent=True) + b'\n'
+            out = getattr(sys.stdout, 'buffer', None)
+            if out is not None:
+                sys.stdout.flush()
+                out.write(data)
+                out.flush()
+            else:
+                sys.stdout.write(data.decode('utf-8'))
         else:
-            print_results(result, show_diff=args.diff, no_color=args.no_color, wiki=args.wiki)
+            print_results(result, show_diff=args.diff, no_color=args.no_color, wiki=args.wiki,
+                          show_objects=not args.profile_only)
             
     except zipfile.BadZipFile:
         logger.error("Invalid or corrupted ZIP/3MF file: %s", filepath)
@@ -945,6 +1565,9 @@ Examples:
     except ET.ParseError as e:
         logger.error("Failed to parse model settings (invalid XML): %s", e)
         sys.exit(1)
+    except FileNotFoundError:
+        logger.error("File not found: %s", filepath)
+        sys.exit(1)
     except ValueError as e:
         # Security-related errors (e.g., Zip Slip attack detection)
         logger.error("Security or validation error: %s", e)
@@ -7,6 +7,14 @@ from pathlib import Path
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_result_cache(tmp_path_factory, monkeypatch) -> Path:
+    """Keep the analyzer result cache out of the user's cache directory."""
+    cache_dir = tmp_path_factory.mktemp("result_cache")
+    monkeypatch.setenv("THREEMF_ANALYZER_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Path:
     """Alias for pytest's built-in tmp_path fixture."""
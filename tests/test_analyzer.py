@@ -1,6 +1,8 @@
 """Unit tests for analyze.py module."""
 
 import json
+import os
+import subprocess
 import sys
 import zipfile
 from io import StringIO
@@ -9,12 +11,20 @@ from unittest.mock import patch
 from xml.etree.ElementTree import ParseError
 
 import pytest
+from defusedxml import ExternalReferenceForbidden
 
 from analyze import (
     ThreeMFAnalyzer,
     _is_custom,
+    _dumps_json,
+    _loads_json,
     _format_object_value,
     _format_support_value,
+    _filament_style,
+    _plate_style,
+    _make_wiki_helpers,
+    analyze_cached,
+    analyze_many,
     main,
     print_results,
     setup_logging,
@@ -23,6 +33,8 @@ from analyze import (
     DEFAULT_EXTRUDER,
     SYSTEM_KEYS,
     INFILL_DENSITY_KEYS,
+    FILAMENT_COLORS,
+    PLATE_COLORS,
 )
 
 
@@ -53,11 +65,84 @@ class TestIsCustom:
         assert _is_custom(10, "10") is False
         assert _is_custom("10", 10) is False
 
+    def test_string_vs_none_global(self):
+        """None profile value compares by its string form."""
+        assert _is_custom("None", None) is False
+        assert _is_custom("5", None) is True
+
     def test_empty_string_vs_none(self):
         """Empty string is a valid value, not None."""
         assert _is_custom("", "default") is True
 
 
+# ═══════════════════════════════════════════════════════════════
+# Test _loads_json helper function
+# ═══════════════════════════════════════════════════════════════
+
+class TestLoadsJson:
+    """Tests for the _loads_json helper function."""
+
+    def test_parses_bytes(self):
+        """Valid JSON bytes should parse to Python objects."""
+        assert _loads_json(b'{"a": ["1", 2]}') == {"a": ["1", 2]}
+
+    def test_invalid_utf8_is_replaced(self):
+        """Invalid UTF-8 should not abort parsing."""
+        assert _loads_json(b'{"a": "x\xffy"}') == {"a": "x\ufffdy"}
+
+    def test_invalid_json_raises(self):
+        """Invalid JSON should raise JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            _loads_json(b'{invalid')
+
+    def test_stdlib_fallback(self):
+        """Parsing should work without orjson installed."""
+        with patch('analyze.orjson', None):
+            assert _loads_json(b'{"a": "1"}') == {"a": "1"}
+
+
+class TestDumpsJson:
+    """Tests for the _dumps_json helper function."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_indent_matches_stdlib(self, use_orjson):
+        """Indented output should match json.dumps(indent=2, ensure_ascii=False)."""
+        data = {"name": "Würfel", "rows": [{"a": 1, "b": None}], "empty": {}}
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        if use_orjson:
+            assert _dumps_json(data, indent=True) == expected
+        else:
+            with patch('analyze.orjson', None):
+                assert _dumps_json(data, indent=True) == expected
+
+    def test_round_trip(self):
+        """Compact output should parse back to the same object."""
+        data = {"a": ["1", 2], "b": "✎"}
+        assert _loads_json(_dumps_json(data)) == data
+
+    @pytest.mark.parametrize("value", [1e-05, 2.5e-07, 1e16, 0.1, float('nan'), float('inf')])
+    def test_floats_match_stdlib(self, value):
+        """Floats, including NaN/Infinity, should be written exactly like json.dumps."""
+        data = {"z_offset": value, "nested": [{"v": value}]}
+        expected = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        assert _dumps_json(data, indent=True) == expected
+
+    def test_nan_survives_cache_round_trip(self, temp_dir: Path, sample_project_settings: dict,
+                                           sample_model_settings_xml: str):
+        """A cached result should equal the freshly analyzed one, NaN included."""
+        threemf_path = temp_dir / "nan.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config",
+                        json.dumps({**sample_project_settings, "z_offset": float('nan'), "tiny": 1e-05}))
+            zf.writestr("Metadata/model_settings.config", sample_model_settings_xml)
+        
+        first = analyze_cached(threemf_path)
+        second = analyze_cached(threemf_path)
+        
+        assert json.dumps(second) == json.dumps(first)
+        assert second['profile_full']['tiny'] == 1e-05
+
+
 # ═══════════════════════════════════════════════════════════════
 # Test Zip Slip protection
 # ═══════════════════════════════════════════════════════════════
@@ -79,15 +164,39 @@ class TestZipSlipProtection:
         with pytest.raises(ValueError, match="Path traversal detected"):
             analyzer.analyze()
 
+    @pytest.mark.parametrize("member", [
+        "..\\..\\evil.txt",
+        "Metadata/../../evil.txt",
+        "C:/Windows/evil.txt",
+        "\\\\server\\share\\evil.txt",
+    ])
+    def test_rejects_windows_and_nested_traversal(self, temp_dir: Path, member: str):
+        """Backslash, drive-letter and nested traversal paths should be rejected."""
+        threemf_path = temp_dir / "malicious_variant.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr(member, "malicious content")
+        
+        with pytest.raises(ValueError):
+            ThreeMFAnalyzer(threemf_path).analyze()
+
+    def test_allows_internal_parent_reference(self, temp_dir: Path):
+        """A '..' that stays inside the archive root is harmless."""
+        threemf_path = temp_dir / "internal_dotdot.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("3D/../3D/model.model", "<model></model>")
+        
+        result = ThreeMFAnalyzer(threemf_path).analyze()
+        assert result['rows'] == []
+
     def test_cleans_up_on_security_error(self, malicious_3mf_traversal: Path):
-        """Temporary directory should be cleaned up after security error."""
+        """Archive should be closed after security error."""
         analyzer = ThreeMFAnalyzer(malicious_3mf_traversal)
         
         with pytest.raises(ValueError):
             analyzer.analyze()
         
-        # Temp dir should be cleaned up
-        assert analyzer.temp_dir is None or not analyzer.temp_dir.exists()
+        # Archive handle should be released
+        assert analyzer._zip is None
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -152,12 +261,33 @@ class TestThreeMFAnalyzer:
         assert result['rows'] == []
 
     def test_analyze_cleanup_on_success(self, sample_3mf: Path):
-        """Temporary files should be cleaned up after successful analysis."""
+        """Archive should be closed after successful analysis."""
         analyzer = ThreeMFAnalyzer(sample_3mf)
         result = analyzer.analyze()
         
-        # After analysis, temp_dir should be cleaned
-        assert analyzer.temp_dir is None or not analyzer.temp_dir.exists()
+        # After analysis, the archive handle should be released
+        assert analyzer._zip is None
+
+    def test_analyze_does_not_extract_to_disk(self, sample_3mf: Path):
+        """Metadata should be read from the archive without a temp directory."""
+        analyzer = ThreeMFAnalyzer(sample_3mf)
+        
+        with patch('zipfile.ZipFile.extractall') as extractall:
+            result = analyzer.analyze()
+        
+        extractall.assert_not_called()
+        assert result['profile']['printer'] == "Bambu Lab A1 mini 0.4 nozzle"
+
+    def test_analyze_without_model_skips_objects(self, sample_3mf: Path):
+        """parse_model=False should not read model_settings.config."""
+        analyzer = ThreeMFAnalyzer(sample_3mf)
+        
+        with patch.object(ThreeMFAnalyzer, '_parse_model_settings') as parse_model:
+            result = analyzer.analyze(parse_model=False)
+        
+        parse_model.assert_not_called()
+        assert result['rows'] == []
+        assert result['profile']['printer'] == "Bambu Lab A1 mini 0.4 nozzle"
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -181,6 +311,86 @@ class TestErrorHandling:
         with pytest.raises(ParseError):
             analyzer.analyze()
 
+    def test_xml_entities_rejected(self, temp_dir: Path, sample_project_settings: dict):
+        """Streaming XML parser should still refuse entity declarations (XXE)."""
+        model_settings_xml = '''<?xml version="1.0"?>
+<!DOCTYPE config [<!ENTITY boom "expanded">]>
+<config>
+    <object id="1">
+        <metadata key="name" value="&boom;"/>
+    </object>
+</config>
+'''
+        threemf_path = temp_dir / "entities.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(sample_project_settings))
+            zf.writestr("Metadata/model_settings.config", model_settings_xml)
+        
+        analyzer = ThreeMFAnalyzer(threemf_path)
+        
+        with pytest.raises(ValueError):
+            analyzer.analyze()
+
+    def test_xml_external_entity_rejected(self, temp_dir: Path, sample_project_settings: dict):
+        """External (SYSTEM) entities must be refused before anything is fetched."""
+        model_settings_xml = '''<?xml version="1.0"?>
+<!DOCTYPE config [<!ENTITY xxe SYSTEM "file:///etc/passwd">]>
+<config>
+    <object id="1">
+        <metadata key="name" value="x"/>
+    </object>
+</config>
+'''
+        threemf_path = temp_dir / "external.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(sample_project_settings))
+            zf.writestr("Metadata/model_settings.config", model_settings_xml)
+
+        analyzer = ThreeMFAnalyzer(threemf_path)
+
+        with pytest.raises(ValueError):
+            analyzer.analyze()
+
+    def test_xml_external_dtd_rejected(self, temp_dir: Path, sample_project_settings: dict):
+        """An external DTD reference must raise ExternalReferenceForbidden."""
+        model_settings_xml = '''<?xml version="1.0"?>
+<!DOCTYPE config SYSTEM "file:///etc/passwd">
+<config>
+    <object id="1">
+        <metadata key="name" value="x"/>
+    </object>
+</config>
+'''
+        threemf_path = temp_dir / "external_dtd.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(sample_project_settings))
+            zf.writestr("Metadata/model_settings.config", model_settings_xml)
+
+        analyzer = ThreeMFAnalyzer(threemf_path)
+
+        with pytest.raises(ExternalReferenceForbidden):
+            analyzer.analyze()
+
+    def test_unexpected_root_element_warns(self, temp_dir: Path, sample_project_settings: dict, caplog):
+        """A non-<config> root should be reported but objects still parsed."""
+        model_settings_xml = '''<?xml version="1.0"?>
+<settings>
+    <object id="1">
+        <metadata key="name" value="Cube"/>
+    </object>
+</settings>
+'''
+        threemf_path = temp_dir / "odd_root.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(sample_project_settings))
+            zf.writestr("Metadata/model_settings.config", model_settings_xml)
+        
+        analyzer = ThreeMFAnalyzer(threemf_path)
+        analyzer.analyze()
+        
+        assert "Unexpected root element 'settings'" in caplog.text
+        assert analyzer.objects['1'].name == 'Cube'
+
     def test_nonexistent_file_raises_error(self, temp_dir: Path):
         """Non-existent file should raise appropriate error."""
         fake_path = temp_dir / "nonexistent.3mf"
@@ -241,6 +451,33 @@ class TestGetValue:
         assert value == 'fallback'
 
 
+class TestGetProfileInfo:
+    """Tests for the _get_profile_info method."""
+
+    def test_list_values_use_first_element(self, temp_dir: Path, sample_model_settings_xml: str):
+        """List values should be reduced to their first element; renamed keys mapped."""
+        project_settings = {
+            "nozzle_diameter": ["0.4", "0.6"],
+            "hot_plate_temp": ["65"],
+            "layer_height": "0.16",
+            "fan_min_speed": [],
+        }
+        threemf_path = temp_dir / "profile_test.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(project_settings))
+            zf.writestr("Metadata/model_settings.config", sample_model_settings_xml)
+        
+        profile = ThreeMFAnalyzer(threemf_path).analyze()['profile']
+        
+        assert profile['nozzle'] == '0.4'
+        assert profile['bed_temperature'] == '65'
+        assert profile['layer_height'] == '0.16'
+        assert profile['fan_min_speed'] == ''
+        assert profile['travel_speed'] == ''
+        assert profile['printer'] == 'Unknown'
+        assert profile['filaments'] == ['Unknown']
+
+
 # ═══════════════════════════════════════════════════════════════
 # Test _get_custom_global_settings method
 # ═══════════════════════════════════════════════════════════════
@@ -310,6 +547,27 @@ class TestGetCustomGlobalSettings:
         custom = analyzer._get_custom_global_settings()
         assert custom == {}
 
+    def test_splits_padded_and_unknown_keys(self, temp_dir: Path, sample_model_settings_xml: str):
+        """Keys should be stripped, empty entries and unknown keys skipped, null values kept."""
+        project_settings = {
+            "printer_settings_id": "Test Printer",
+            "print_settings_id": "Test Process",
+            "filament_settings_id": ["Test Filament"],
+            "wall_loops": "3",
+            "seam_gap": None,
+            "different_settings_to_system": [" wall_loops ;;missing_key; seam_gap;"],
+        }
+        
+        threemf_path = temp_dir / "split_test.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(project_settings))
+            zf.writestr("Metadata/model_settings.config", sample_model_settings_xml)
+        
+        analyzer = ThreeMFAnalyzer(threemf_path)
+        analyzer.analyze()
+        
+        assert analyzer._get_custom_global_settings() == {'wall_loops': '3', 'seam_gap': None}
+
     def test_handles_missing_diff_settings(self, temp_dir: Path, sample_model_settings_xml: str):
         """Should return empty dict when different_settings_to_system is missing."""
         project_settings = {
@@ -450,6 +708,30 @@ class TestFormatSupportValue:
         assert 'bold yellow' in result
 
 
+class TestCellStyles:
+    """Tests for the cached plate/filament cell style helpers."""
+
+    def test_plate_colors_cycle(self):
+        """Plate numbers should cycle through PLATE_COLORS."""
+        assert _plate_style('1') == f"bold {PLATE_COLORS[0]}"
+        assert _plate_style(str(len(PLATE_COLORS) + 1)) == f"bold {PLATE_COLORS[0]}"
+
+    def test_filament_colors(self):
+        """Numeric filaments map to FILAMENT_COLORS, others fall back to white."""
+        assert _filament_style('2') == FILAMENT_COLORS[1]
+        assert _filament_style('x') == 'white'
+
+    def test_bracketed_name_rendered_literally(self, sample_3mf: Path, capsys, monkeypatch):
+        """Object names should not be parsed as Rich markup."""
+        monkeypatch.setenv('FORCE_COLOR', '1')
+        result = ThreeMFAnalyzer(sample_3mf).analyze()
+        result['rows'][0]['name'] = "[red]Bracket[/red]"
+        
+        print_results(result)
+        
+        assert "[red]Bracket[/red]" in capsys.readouterr().out
+
+
 # ═══════════════════════════════════════════════════════════════
 # Test constants
 # ═══════════════════════════════════════════════════════════════
@@ -474,6 +756,7 @@ class TestConstants:
 
     def test_infill_density_keys(self):
         """Infill density keys should include both variants."""
+        assert isinstance(INFILL_DENSITY_KEYS, frozenset)
         assert 'sparse_infill_density' in INFILL_DENSITY_KEYS
         assert 'skeleton_infill_density' in INFILL_DENSITY_KEYS
 
@@ -503,6 +786,24 @@ class TestCLI:
         assert 'profile' in data
         assert 'rows' in data
 
+    def test_main_json_output_does_not_import_rich(self, sample_3mf: Path, isolated_result_cache: Path):
+        """--json should never load Rich."""
+        code = (
+            "import sys, analyze; "
+            f"sys.argv = ['analyze.py', {str(sample_3mf)!r}, '--json']; "
+            "analyze.main(); "
+            "sys.exit(any(m == 'rich' or m.startswith('rich.') for m in sys.modules))"
+        )
+        proc = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            env={**os.environ, 'THREEMF_ANALYZER_CACHE_DIR': str(isolated_result_cache)},
+        )
+        
+        assert proc.returncode == 0, proc.stderr
+        assert json.loads(proc.stdout)['file'] == sample_3mf.name
+
     def test_main_diff_mode(self, sample_3mf: Path, capsys):
         """--diff flag should not cause errors."""
         with patch.object(sys, 'argv', ['analyze.py', str(sample_3mf), '--diff']):
@@ -542,13 +843,14 @@ class TestCLI:
                 main()
             assert exc_info.value.code != 0
 
-    def test_main_nonexistent_file_exits(self, temp_dir: Path):
+    def test_main_nonexistent_file_exits(self, temp_dir: Path, caplog):
         """main() should exit with error for non-existent file."""
         fake_path = temp_dir / "does_not_exist.3mf"
         with patch.object(sys, 'argv', ['analyze.py', str(fake_path)]):
             with pytest.raises(SystemExit) as exc_info:
                 main()
             assert exc_info.value.code == 1
+        assert "File not found" in caplog.text
 
     def test_main_bad_zip_exits(self, temp_dir: Path):
         """main() should exit with error for invalid ZIP file."""
@@ -560,6 +862,169 @@ class TestCLI:
                 main()
             assert exc_info.value.code == 1
 
+    def test_main_no_cache_flag(self, sample_3mf: Path, isolated_result_cache: Path):
+        """--no-cache should work and leave the cache empty."""
+        with patch.object(sys, 'argv', ['analyze.py', str(sample_3mf), '--json', '--no-cache']):
+            main()
+        
+        assert list(isolated_result_cache.glob('*.json')) == []
+
+    def test_main_profile_only_flag(self, sample_3mf: Path, capsys, isolated_result_cache: Path):
+        """--profile-only should print settings without OBJECTS and never cache."""
+        with patch.object(sys, 'argv', ['analyze.py', str(sample_3mf), '--profile-only']):
+            main()
+        
+        out = capsys.readouterr().out
+        assert "GLOBAL SETTINGS" in out
+        assert "OBJECTS" not in out
+        assert "TestObject" not in out
+        assert list(isolated_result_cache.glob('*.json')) == []
+
+
+class TestAnalyzeMany:
+    """Tests for the parallel analyze_many() entry point."""
+
+    def test_results_in_input_order(self, sample_3mf: Path, multi_plate_3mf: Path):
+        """Results should match input order and single-file analysis."""
+        results = analyze_many([multi_plate_3mf, sample_3mf], max_workers=2)
+        
+        assert [r['file'] for r in results] == [multi_plate_3mf.name, sample_3mf.name]
+        assert results[1] == ThreeMFAnalyzer(sample_3mf).analyze()
+
+    def test_empty_input(self):
+        """No paths should give no results."""
+        assert analyze_many([]) == []
+
+    def test_error_propagates(self, sample_3mf: Path, temp_dir: Path):
+        """A failing file should raise from analyze_many."""
+        bad_file = temp_dir / "bad.3mf"
+        bad_file.write_text("not a zip")
+        
+        with pytest.raises(zipfile.BadZipFile):
+            analyze_many([sample_3mf, bad_file], max_workers=2)
+
+
+class TestResultCache:
+    """Tests for the on-disk analyze_cached() result cache."""
+
+    def test_cache_hit_skips_analysis(self, sample_3mf: Path, isolated_result_cache: Path):
+        """Second call for an unchanged file should not re-parse the archive."""
+        first = analyze_cached(sample_3mf)
+        assert len(list(isolated_result_cache.glob('*.json'))) == 1
+        
+        with patch.object(ThreeMFAnalyzer, 'analyze') as analyze:
+            second = analyze_cached(sample_3mf)
+        
+        analyze.assert_not_called()
+        assert second == first
+
+    def test_modified_file_invalidates_cache(self, sample_3mf: Path, sample_project_settings: dict,
+                                             sample_model_settings_xml: str):
+        """Changing the file should produce a fresh result."""
+        analyze_cached(sample_3mf)
+        
+        sample_project_settings['printer_settings_id'] = "Other Printer With Longer Name"
+        with zipfile.ZipFile(sample_3mf, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(sample_project_settings))
+            zf.writestr("Metadata/model_settings.config", sample_model_settings_xml)
+        
+        result = analyze_cached(sample_3mf)
+        assert result['profile']['printer'] == "Other Printer With Longer Name"
+
+    def test_changed_mtime_invalidates_cache(self, sample_3mf: Path, isolated_result_cache: Path):
+        """Touching the file (same size) should miss the cached entry."""
+        analyze_cached(sample_3mf)
+        st = sample_3mf.stat()
+        os.utime(sample_3mf, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        
+        with patch.object(ThreeMFAnalyzer, 'analyze', return_value={'rows': []}) as analyze:
+            analyze_cached(sample_3mf)
+        
+        analyze.assert_called_once()
+
+    def test_changed_size_invalidates_cache(self, sample_3mf: Path, isolated_result_cache: Path):
+        """A size change with the same mtime should miss the cached entry."""
+        analyze_cached(sample_3mf)
+        st = sample_3mf.stat()
+        with open(sample_3mf, 'ab') as f:
+            f.write(b'\0')
+        os.utime(sample_3mf, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        with patch.object(ThreeMFAnalyzer, 'analyze', return_value={'rows': []}) as analyze:
+            analyze_cached(sample_3mf)
+        
+        analyze.assert_called_once()
+
+    def test_cache_hit_reports_requested_name(self, sample_3mf: Path, isolated_result_cache: Path):
+        """An entry written through a symlink should report the real file's own name."""
+        alias = sample_3mf.with_name("alias.3mf")
+        try:
+            alias.symlink_to(sample_3mf)
+        except OSError:
+            pytest.skip("symlinks not supported")
+        
+        assert analyze_cached(alias)['file'] == "alias.3mf"
+        assert analyze_cached(sample_3mf)['file'] == sample_3mf.name
+        assert len(list(isolated_result_cache.glob('*.json'))) == 1
+
+    def test_no_cache_bypasses_cache(self, sample_3mf: Path, isolated_result_cache: Path):
+        """use_cache=False should neither read nor write cache entries."""
+        result = analyze_cached(sample_3mf, use_cache=False)
+        
+        assert result['file'] == sample_3mf.name
+        assert list(isolated_result_cache.glob('*.json')) == []
+
+    def test_corrupt_cache_entry_is_ignored(self, sample_3mf: Path, isolated_result_cache: Path):
+        """An unreadable cache entry should fall back to analysis."""
+        analyze_cached(sample_3mf)
+        cache_file = next(isolated_result_cache.glob('*.json'))
+        cache_file.write_text("{not json")
+        
+        result = analyze_cached(sample_3mf)
+        assert result['profile']['printer'] == "Bambu Lab A1 mini 0.4 nozzle"
+
+    def test_schema_bump_invalidates_cache(self, sample_3mf: Path, isolated_result_cache: Path):
+        """Entries written under another _CACHE_SCHEMA must not be reused."""
+        analyze_cached(sample_3mf)
+        
+        with patch('analyze._CACHE_SCHEMA', -1):
+            with patch.object(ThreeMFAnalyzer, 'analyze', return_value={'rows': []}) as analyze:
+                analyze_cached(sample_3mf)
+        
+        analyze.assert_called_once()
+
+    def test_old_entries_are_pruned(self, sample_3mf: Path, isolated_result_cache: Path):
+        """Writing an entry should drop the oldest ones beyond the limit."""
+        for i in range(3):
+            stale = isolated_result_cache / f"stale{i}.json"
+            stale.write_text("{}")
+            os.utime(stale, ns=(i, i))
+        
+        with patch('analyze.CACHE_MAX_ENTRIES', 2):
+            analyze_cached(sample_3mf)
+        
+        assert sorted(p.name for p in isolated_result_cache.glob('stale*.json')) == ['stale2.json']
+        assert len(list(isolated_result_cache.glob('*.json'))) == 2
+
+    def test_profile_only_is_not_cached(self, sample_3mf: Path, isolated_result_cache: Path):
+        """A profile-only result must not be stored in place of the full one."""
+        result = analyze_cached(sample_3mf, parse_model=False)
+        
+        assert result['rows'] == []
+        assert list(isolated_result_cache.glob('*.json')) == []
+
+    def test_profile_only_reuses_full_cache_entry(self, sample_3mf: Path, isolated_result_cache: Path):
+        """A cached full result should serve profile-only requests too."""
+        full = analyze_cached(sample_3mf)
+        
+        with patch.object(ThreeMFAnalyzer, 'analyze') as analyze:
+            result = analyze_cached(sample_3mf, parse_model=False)
+        
+        analyze.assert_not_called()
+        assert result['rows'] == []
+        assert result['profile'] == full['profile']
+        assert analyze_cached(sample_3mf)['rows'] == full['rows']
+
 
 class TestPrintResults:
     """Tests for print_results function."""
@@ -593,6 +1058,102 @@ class TestPrintResults:
         
         print_results(result, wiki=True)
 
+    def test_print_results_plain_when_not_terminal(self, sample_3mf: Path, capsys):
+        """Non-terminal output should be plain text without box drawing."""
+        result = ThreeMFAnalyzer(sample_3mf).analyze()
+        
+        print_results(result, show_diff=True)
+        out = capsys.readouterr().out
+        
+        assert "GLOBAL SETTINGS" in out
+        assert "TestObject" in out
+        assert "wall_loops: 4" in out
+        assert "* = custom value" in out
+        assert "╭" not in out
+        assert "\x1b[" not in out
+
+    def test_print_results_rich_when_forced(self, sample_3mf: Path, capsys, monkeypatch):
+        """Forced terminal output should still render Rich panels."""
+        monkeypatch.setenv('FORCE_COLOR', '1')
+        result = ThreeMFAnalyzer(sample_3mf).analyze()
+        
+        print_results(result)
+        out = capsys.readouterr().out
+        
+        assert "╭" in out
+        assert "TestObject" in out
+
+    def test_custom_global_value_rendered_literally(self, sample_3mf: Path, capsys, monkeypatch):
+        """Custom global values should not be parsed as Rich markup."""
+        monkeypatch.setenv('FORCE_COLOR', '1')
+        result = ThreeMFAnalyzer(sample_3mf).analyze()
+        result['custom_global'] = {'filename_format': '[input_filename_base].gcode'}
+        
+        print_results(result)
+        
+        assert '[input_filename_base].gcode' in capsys.readouterr().out
+
+    def test_profile_values_rendered_literally(self, sample_3mf: Path, capsys, monkeypatch):
+        """Profile and global setting values should not be parsed as Rich markup."""
+        monkeypatch.setenv('FORCE_COLOR', '1')
+        result = ThreeMFAnalyzer(sample_3mf).analyze()
+        result['profile']['process'] = "0.20mm [custom]"
+        result['profile']['seam_position'] = "[aligned]"
+        
+        print_results(result)
+        out = capsys.readouterr().out
+        
+        assert "0.20mm [custom]" in out
+        assert "[aligned]" in out
+
+    def test_emoji_codes_rendered_literally(self, sample_3mf: Path, capsys, monkeypatch):
+        """Setting values like ':smile:' should not be turned into emoji."""
+        monkeypatch.setenv('FORCE_COLOR', '1')
+        result = ThreeMFAnalyzer(sample_3mf).analyze()
+        result['rows'][0]['custom_settings'] = {'notes': ':smile:'}
+
+        print_results(result)
+
+        assert ":smile:" in capsys.readouterr().out
+
+    def test_print_results_no_color_is_plain(self, sample_3mf: Path, capsys, monkeypatch):
+        """no_color should use the plain path even on a terminal."""
+        monkeypatch.setenv('FORCE_COLOR', '1')
+        result = ThreeMFAnalyzer(sample_3mf).analyze()
+        
+        print_results(result, no_color=True)
+        out = capsys.readouterr().out
+        
+        assert "╭" not in out
+        assert "TestObject" in out
+
+
+class TestWikiHelpers:
+    """Tests for _make_wiki_helpers memoization."""
+
+    def test_disabled_helpers_passthrough(self):
+        """Disabled helpers should return names unchanged."""
+        wiki_label, wiki_key = _make_wiki_helpers(False)
+        assert wiki_label("Layer Height", "layer_height") == "Layer Height"
+        assert wiki_key("layer_height") == "layer_height"
+
+    def test_enabled_helpers_are_memoized(self):
+        """Repeated labels should not look up the wiki URL again."""
+        _make_wiki_helpers.cache_clear()
+        try:
+            with patch('settings_wiki.get_wiki_url', return_value='https://example.com/lh') as get_url:
+                wiki_label, wiki_key = _make_wiki_helpers(True)
+                first = wiki_label("Layer Height", "layer_height")
+                second = wiki_label("Layer Height", "layer_height")
+                wiki_key("layer_height")
+                wiki_key("layer_height")
+            
+            assert first == second == "[link=https://example.com/lh]Layer Height[/link]"
+            assert get_url.call_count == 1  # URL lookup shared by both helpers
+            assert _make_wiki_helpers(True) == (wiki_label, wiki_key)
+        finally:
+            _make_wiki_helpers.cache_clear()
+
 
 class TestSetupLogging:
     """Tests for setup_logging function."""
@@ -641,6 +1202,37 @@ class TestMultiPlateSupport:
         assert len(analyzer.plates[0]['objects']) == 1
         assert len(analyzer.plates[1]['objects']) == 2
 
+    def test_plate_objects_sorted_stably(self, temp_dir: Path, sample_project_settings: dict):
+        """Instances are sorted by identify_id, ties keep document order."""
+        model_settings_xml = '''<?xml version="1.0" encoding="UTF-8"?>
+<config>
+    <plate>
+        <metadata key="plater_id" value="1"/>
+        <model_instance>
+            <metadata key="object_id" value="9"/>
+            <metadata key="identify_id" value="5"/>
+        </model_instance>
+        <model_instance>
+            <metadata key="object_id" value="10"/>
+            <metadata key="identify_id" value="5"/>
+        </model_instance>
+        <model_instance>
+            <metadata key="object_id" value="11"/>
+            <metadata key="identify_id" value="1"/>
+        </model_instance>
+    </plate>
+</config>
+'''
+        threemf_path = temp_dir / "ties.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(sample_project_settings))
+            zf.writestr("Metadata/model_settings.config", model_settings_xml)
+        
+        analyzer = ThreeMFAnalyzer(threemf_path)
+        analyzer.analyze()
+        
+        assert analyzer.plates[0]['objects'] == ['11', '9', '10']
+
 
 # ═══════════════════════════════════════════════════════════════
 # Test Multi-Part Objects
@@ -664,6 +1256,17 @@ class TestMultiPartObjects:
         assert 'PartB' in names
         assert 'PartC' in names
 
+    def test_part_rows_share_object_row_schema(self, multi_part_object_3mf: Path):
+        """Object and part rows should have the same keys in the same order."""
+        result = ThreeMFAnalyzer(multi_part_object_3mf).analyze()
+        
+        parent = next(r for r in result['rows'] if r['is_parent'])
+        part = next(r for r in result['rows'] if r['is_part'])
+        
+        assert list(part) == list(parent)
+        assert part['plate'] == '' and part['brim'] == '' and part['layer_height'] == ''
+        assert None not in parent.values()
+
     def test_part_custom_settings(self, multi_part_object_3mf: Path):
         """Parts should have their own custom settings."""
         analyzer = ThreeMFAnalyzer(multi_part_object_3mf)
@@ -698,6 +1301,126 @@ class TestMultiPartObjects:
         assert part_b.get('filament', part_b.get('extruder')) == '2'
 
 
+# ═══════════════════════════════════════════════════════════════
+# Test Object Metadata Parsing
+# ═══════════════════════════════════════════════════════════════
+
+class TestObjectMetadata:
+    """Tests for per-object metadata overrides."""
+
+    def test_tracked_and_custom_keys(self, temp_dir: Path, sample_project_settings: dict):
+        """Tracked keys populate object fields; all overrides land in custom_settings."""
+        model_settings_xml = '''<?xml version="1.0" encoding="UTF-8"?>
+<config>
+    <object id="1">
+        <metadata key="name" value="Overrides"/>
+        <metadata key="extruder" value="2"/>
+        <metadata key="layer_height" value="0.12"/>
+        <metadata key="brim_type" value="brim_ears"/>
+        <metadata key="skeleton_infill_density" value="40%"/>
+        <metadata key="ironing_type" value="top"/>
+        <metadata key="matrix" value="1 0 0 0"/>
+    </object>
+</config>
+'''
+        threemf_path = temp_dir / "overrides.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(sample_project_settings))
+            zf.writestr("Metadata/model_settings.config", model_settings_xml)
+        
+        analyzer = ThreeMFAnalyzer(threemf_path)
+        analyzer.analyze()
+        
+        obj = analyzer.objects['1']
+        assert obj.name == 'Overrides'
+        assert obj.extruder == '2'
+        assert obj.layer_height == '0.12'
+        assert obj.brim_type == 'brim_ears'
+        assert obj.sparse_infill_density == '40%'
+        assert obj.custom_settings == {
+            'layer_height': '0.12',
+            'brim_type': 'brim_ears',
+            'skeleton_infill_density': '40%',
+            'ironing_type': 'top',
+        }
+
+    def test_plate_object_missing_from_model(self, temp_dir: Path, sample_project_settings: dict):
+        """A plate instance without an <object> should still get a placeholder row."""
+        model_settings_xml = '''<?xml version="1.0" encoding="UTF-8"?>
+<config>
+    <plate>
+        <metadata key="plater_id" value="1"/>
+        <model_instance>
+            <metadata key="object_id" value="7"/>
+        </model_instance>
+    </plate>
+</config>
+'''
+        threemf_path = temp_dir / "missing_object.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(sample_project_settings))
+            zf.writestr("Metadata/model_settings.config", model_settings_xml)
+        
+        rows = ThreeMFAnalyzer(threemf_path).analyze()['rows']
+        
+        assert len(rows) == 1
+        assert rows[0]['name'] == 'Object 7'
+        assert rows[0]['filament'] == DEFAULT_EXTRUDER
+        assert rows[0]['custom_settings'] == {}
+
+    def test_sparse_infill_preferred_over_legacy_key(self, temp_dir: Path, sample_project_settings: dict):
+        """sparse_infill_density should win over the legacy skeleton key."""
+        model_settings_xml = '''<?xml version="1.0" encoding="UTF-8"?>
+<config>
+    <object id="1">
+        <metadata key="name" value="BothInfill"/>
+        <metadata key="skeleton_infill_density" value="10%"/>
+        <metadata key="sparse_infill_density" value="25%"/>
+    </object>
+</config>
+'''
+        threemf_path = temp_dir / "both_infill.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(sample_project_settings))
+            zf.writestr("Metadata/model_settings.config", model_settings_xml)
+        
+        analyzer = ThreeMFAnalyzer(threemf_path)
+        analyzer.analyze()
+        
+        obj = analyzer.objects['1']
+        assert obj.sparse_infill_density == '25%'
+        assert obj.layer_height is None
+        assert set(obj.custom_settings) == set(INFILL_DENSITY_KEYS)
+
+    def test_empty_sparse_infill_falls_back_to_legacy_key(self, temp_dir: Path, sample_project_settings: dict):
+        """An empty sparse_infill_density should fall back to the skeleton key."""
+        model_settings_xml = '''<?xml version="1.0" encoding="UTF-8"?>
+<config>
+    <object id="1">
+        <metadata key="name" value="EmptySparse"/>
+        <metadata key="sparse_infill_density" value=""/>
+        <metadata key="skeleton_infill_density" value="40%"/>
+    </object>
+    <plate>
+        <metadata key="plater_id" value="1"/>
+        <model_instance>
+            <metadata key="object_id" value="1"/>
+        </model_instance>
+    </plate>
+</config>
+'''
+        threemf_path = temp_dir / "empty_sparse.3mf"
+        with zipfile.ZipFile(threemf_path, 'w') as zf:
+            zf.writestr("Metadata/project_settings.config", json.dumps(sample_project_settings))
+            zf.writestr("Metadata/model_settings.config", model_settings_xml)
+        
+        analyzer = ThreeMFAnalyzer(threemf_path)
+        rows = analyzer.analyze()['rows']
+        
+        assert analyzer.objects['1'].sparse_infill_density == '40%'
+        assert rows[0]['infill'] == '40'
+
+
 # ═══════════════════════════════════════════════════════════════
 # Test Unicode/Non-ASCII Names
 # ═══════════════════════════════════════════════════════════════